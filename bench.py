@@ -0,0 +1,127 @@
+##########################################################################
+#          CAT throughput and latency benchmark (no Qt here)             #
+##########################################################################
+"""
+Runs the bulk read and the batched send used by "Get config from FT-891"
+and "Send config to FT-891" at each CAT RATE, on the simulator or on the
+radio, and saves the timings in a JSON file to compare builds:
+
+    python bench.py --port ft891:// --repeat 3 --output bench.json
+    python bench.py --port /dev/ttyUSB0 --baudrate 9600 --rates 4800,38400
+
+The radio is put back at its starting CAT RATE at the end.
+"""
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+
+from cat import RATES, new_port, switch_rate, read_menus, write_frames
+from const import APP_VERSION, ENCODER, CAT_WINDOW, CAT_CHUNK, MENU_QUERIES, MENU_BY_CODE
+
+
+def percentiles(values):
+    """ p50, p95 and p99 in msec """
+    if len(values) < 2:
+        values = values * 2 or [0., 0.]
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50_ms": cuts[49] * 1000, "p95_ms": cuts[94] * 1000, "p99_ms": cuts[98] * 1000}
+
+
+def bench_read(rig, repeat, window):
+    """ Pipelined read of the whole menu, like get_config_from_radio """
+    latencies = []
+    errors = 0
+    sent = received = 0
+    replies = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        replies, latency = read_menus(rig, MENU_QUERIES, window=window)
+        latencies.extend(latency.values())
+        errors += len(MENU_QUERIES) - sum(1 for query, resp in replies.items()
+                                          if resp[:6] == query[:6])
+        sent += sum(len(query) for query in MENU_QUERIES)
+        received += sum(len(resp) for resp in replies.values())
+    elapsed = time.perf_counter() - start
+
+    result = {"total_s": elapsed / repeat,
+              "bytes": (sent + received) // repeat,
+              "bytes_per_s": (sent + received) / elapsed,
+              "errors": errors}
+    result.update(percentiles(latencies))
+    return result, replies
+
+
+def bench_send(rig, repeat, chunk, replies):
+    """ Batched send of the values just read, like send_config_2_radio """
+    frames = [resp for query, resp in replies.items()
+              if resp[:6] == query[:6] and MENU_BY_CODE[query[2:6].decode(ENCODER)].writable]
+    buffer = b"".join(frames)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        write_frames(rig, buffer, chunk=chunk)
+    elapsed = time.perf_counter() - start
+    return {"total_s": elapsed / repeat,
+            "frames": len(frames),
+            "bytes": len(buffer),
+            "bytes_per_s": len(buffer) * repeat / elapsed if elapsed else 0.}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CPyS-891 CAT benchmark")
+    parser.add_argument("--port", default="ft891://bench",
+                        help="serial port or ft891:// simulator URL")
+    parser.add_argument("--baudrate", type=int, default=9600,
+                        help="current CAT RATE of the radio")
+    parser.add_argument("--rates", default=",".join(str(rate) for rate in RATES),
+                        help="CAT RATEs to measure, comma separated")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--window", type=int, default=CAT_WINDOW)
+    parser.add_argument("--chunk", type=int, default=CAT_CHUNK)
+    parser.add_argument("--output", default="bench.json")
+    args = parser.parse_args(argv)
+    rates = [int(rate) for rate in args.rates.split(",")]
+    if not set(rates) <= set(RATES):
+        parser.error(f"--rates must be among {', '.join(str(rate) for rate in RATES)}")
+
+    rig = new_port(args.port, baudrate=args.baudrate, timeout=0.1, rtscts=True)
+    rig.port = args.port
+    rig.open()
+    if not switch_rate(rig, args.baudrate):
+        print(f"No answer from {args.port} at {args.baudrate} bds", file=sys.stderr)
+        return 1
+
+    results = []
+    try:
+        for baudrate in rates:
+            if not switch_rate(rig, baudrate):
+                print(f"{baudrate} bds: no answer, skipped", file=sys.stderr)
+                continue
+            read, replies = bench_read(rig, args.repeat, args.window)
+            send = bench_send(rig, args.repeat, args.chunk, replies)
+            results.append({"baudrate": baudrate, "read": read, "send": send})
+            print(f"{baudrate:>6} bds  read {read['total_s']:6.3f} s "
+                  f"p50 {read['p50_ms']:6.1f} p95 {read['p95_ms']:6.1f} "
+                  f"p99 {read['p99_ms']:6.1f} ms  {read['bytes_per_s']:7.0f} B/s  "
+                  f"send {send['total_s']:6.3f} s {send['bytes_per_s']:7.0f} B/s")
+    finally:
+        switch_rate(rig, args.baudrate)
+        rig.close()
+
+    report = {"version": APP_VERSION,
+              "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "python": platform.python_version(),
+              "port": args.port,
+              "repeat": args.repeat,
+              "window": args.window,
+              "chunk": args.chunk,
+              "results": results}
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
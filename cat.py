@@ -0,0 +1,406 @@
+##########################################################################
+#          CAT protocol helpers for the Yaesu FT-891 (no Qt here)        #
+##########################################################################
+import re
+import json
+import time
+import threading
+
+import serial
+import serial.tools.list_ports
+
+from const import (ENCODER, CAT_WINDOW, CAT_CHUNK, CAT_RATE, PROBE_TIMEOUT, PROBE_DEADLINE, PORT_CACHE,
+                   PROBE_POOL, FT891_USB, RATE_SETTLE, VERIFY_RETRIES, MODES, FUNCTION_KEYS, MEMORY_COMMANDS)
+
+# baudrate -> CAT RATE menu value
+RATES = {int(text.split()[0]): value for text, value in CAT_RATE.items()}
+# Reply to the FA; handshake
+FA_REPLY = re.compile(rb"^FA\d{9};$")
+# Several radios can be connected at once (fleet), one cache writer at a time
+CACHE_LOCK = threading.Lock()
+# MD / IF mode code -> mode name
+MODE_NAMES = {code: name for name, code in MODES.items()}
+
+
+def new_port(port, **kwargs):
+    """ Unopened pyserial port, "ft891://" gives the simulated radio """
+    if port.startswith("ft891://"):
+        import ft891sim
+        return ft891sim.Serial(**kwargs)
+    return serial.Serial(**kwargs)
+
+
+def probe(rig, tries=1):
+    """ True if an FT-891 answers the FA; handshake at the current baudrate """
+    for _ in range(tries):
+        rig.reset_input_buffer()
+        rig.write(b"FA;")
+        resp = rig.read_until(b";")
+        # Auto Information frames can come before the reply
+        while resp.endswith(b";") and not FA_REPLY.match(resp):
+            resp = rig.read_until(b";")
+        if FA_REPLY.match(resp):
+            return True
+    return False
+
+
+def detect_baudrate(rig, rates):
+    """ First of the baudrates the radio answers at, or None """
+    for rate in rates:
+        rig.baudrate = int(rate)
+        if probe(rig):
+            return int(rate)
+    return None
+
+
+def switch_rate(rig, baudrate, settle=RATE_SETTLE):
+    """ Set the CAT RATE of the radio and follow it
+
+    True if the radio answers at the new rate. Otherwise the previous
+    CAT RATE is written at the new baudrate, the radio may have taken it
+    without answering, and the port goes back: False when the radio then
+    answers at the previous rate, None when it answers at neither.
+    """
+    previous = rig.baudrate
+    if previous == baudrate:
+        return probe(rig, tries=2) or None
+    rig.write(b"EX0506" + RATES[baudrate] + b";")
+    rig.flush()
+    time.sleep(settle)
+    rig.baudrate = baudrate
+    if probe(rig, tries=2):
+        return True
+
+    rig.write(b"EX0506" + RATES[previous] + b";")
+    rig.flush()
+    time.sleep(settle)
+    rig.baudrate = previous
+    return False if probe(rig, tries=2) else None
+
+
+def port_key(info):
+    """ Cache key of a port, the USB serial number and interface when there is one """
+    if info.serial_number:
+        return f"{info.serial_number}:{info.location}"
+    return info.device
+
+
+def load_port_cache(path=PORT_CACHE):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def remember_port(port, baudrate, path=PORT_CACHE):
+    """ Save the port and baudrate the FT-891 answered on """
+    for info in serial.tools.list_ports.comports():
+        if info.device == port:
+            with CACHE_LOCK:
+                cache = load_port_cache(path)
+                cache[port_key(info)] = {"port": port, "baudrate": baudrate}
+                try:
+                    with open(path, "w") as file:
+                        json.dump(cache, file, indent=4)
+                except OSError:
+                    pass
+            return
+
+
+def cat_port(info):
+    """ True for the CAT port of the FT-891 USB bridge
+
+    Its other port (Standard) keys the transmitter with RTS/DTR, it is never
+    opened, nor are the ports of other adapters: a sound card interface
+    (Digirig, SignaLink...) may key PTT with RTS too.
+    """
+    if (info.vid, info.pid) != FT891_USB:
+        return False
+    text = f"{info.interface or ''} {info.description or ''}"
+    if "Standard" in text:
+        return False
+    return "Enhanced" in text or (info.location or "").endswith(".0")
+
+
+def probe_port(port, rates, timeout=PROBE_TIMEOUT):
+    """ Baudrate an FT-891 answers at on this port, or None """
+    rates = list(dict.fromkeys(int(rate) for rate in rates))
+    try:
+        rig = new_port(port, baudrate=int(rates[0]), timeout=timeout, rtscts=True)
+        rig.port = port
+        rig.open()
+    except (serial.SerialException, OSError, ValueError):
+        return None
+    try:
+        return detect_baudrate(rig, rates)
+    except (serial.SerialException, OSError):
+        return None
+    finally:
+        rig.close()
+
+
+def discover_port(preferred, rates, deadline=PROBE_DEADLINE, path=PORT_CACHE, scan=True):
+    """ Find the FT-891 among the serial ports, returns (port, baudrate) or None
+
+    The cached port of a known USB adapter is tried first, alone. Then the
+    preferred port and, with `scan`, the CAT ports of the FT-891 USB bridges
+    (cat_port) are probed in parallel, PROBE_POOL at a time, the first one
+    to answer before the deadline wins. Other serial ports are never opened.
+    """
+    cache = load_port_cache(path)
+    ports = serial.tools.list_ports.comports()
+
+    for info in ports:
+        known = cache.get(port_key(info))
+        if known is not None:
+            baudrate = probe_port(info.device, [known["baudrate"], *rates])
+            if baudrate is not None:
+                remember_port(info.device, baudrate, path)
+                return info.device, baudrate
+
+    # Imported here, only when the cached port does not answer (it loads logging)
+    import concurrent.futures
+
+    candidates = [preferred]
+    if scan:
+        candidates += [info.device for info in ports if cat_port(info) and info.device != preferred]
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(len(candidates), PROBE_POOL))
+    futures = {pool.submit(probe_port, port, rates): port for port in candidates}
+    found = None
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=deadline):
+            if future.result() is not None:
+                found = futures[future], future.result()
+                break
+    except concurrent.futures.TimeoutError:
+        pass
+    # Probes still running close their port on their own
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    if found is not None:
+        remember_port(*found, path)
+    return found
+
+
+def read_menus(rig, queries, window=CAT_WINDOW, progress=None, cancel=None, unsolicited=None):
+    """ Pipelined read of EX menus or function states
+
+    Keeps up to `window` queries in flight, then demultiplexes the replies
+    by their key, EXnnnn for a menu (frame_key). Returns two dicts keyed by the query frame:
+    the raw replies and the per-parameter latency in seconds. Setting the
+    `cancel` event stops sending new queries. Frames nobody asked for
+    (Auto Information) are given to `unsolicited` when it is set, dropped
+    otherwise: only a "?;" is taken as the reply of the oldest query.
+    """
+    replies = {}
+    latency = {}
+    pending = list(queries)
+    in_flight = []
+    sent_at = {}
+    by_key = {}
+
+    while pending or in_flight:
+        # On cancel, only drain the replies already in flight
+        if cancel is not None and cancel.is_set():
+            pending = []
+            if not in_flight:
+                break
+
+        # Fill the window with back-to-back queries
+        burst = []
+        while pending and len(in_flight) < window:
+            query = pending.pop(0)
+            in_flight.append(query)
+            by_key[frame_key(query)] = query
+            burst.append(query)
+        if burst:
+            now = time.perf_counter()
+            for query in burst:
+                sent_at[query] = now
+            rig.write(b"".join(burst))
+
+        resp = rig.read_until(b";")
+        if not resp.endswith(b";"):
+            # Timeout, the remaining queries are left unanswered
+            break
+
+        query = by_key.pop(frame_key(resp), None)
+        if query is None and resp != b"?;":
+            # Nobody asked for it (Auto Information, noise), it takes no reply's place
+            if unsolicited is not None:
+                unsolicited(resp)
+            continue
+        if query is None:
+            # "?;" belongs to the oldest query
+            query = in_flight[0]
+            del by_key[frame_key(query)]
+        in_flight.remove(query)
+        replies[query] = resp
+        latency[query] = time.perf_counter() - sent_at[query]
+
+        if progress is not None and (len(replies) % window == 0 or not in_flight):
+            progress(len(replies))
+
+    return replies, latency
+
+
+def write_frames(rig, buffer, chunk=CAT_CHUNK, progress=None, cancel=None):
+    """ Batched send of pre-built set commands
+
+    The buffer is written in slices of `chunk` bytes, which should not
+    exceed the rig input buffer. Hardware flow control (rtscts) holds the
+    next slice back while the FT-891 is busy. Returns the number of bytes
+    written, less than the buffer when `cancel` is set.
+    """
+    view = memoryview(buffer)
+    sent = 0
+    while sent < len(view):
+        if cancel is not None and cancel.is_set():
+            # Finish the frame cut by the last slice, the rig would reject it
+            if sent and buffer[sent - 1:sent] != b";":
+                end = buffer.index(b";", sent) + 1
+                rig.write(view[sent:end])
+                sent = end
+            break
+        rig.write(view[sent:sent + chunk])
+        # Wait for the slice to leave the port, so progress and cancel
+        # follow the wire and not the OS buffer
+        rig.flush()
+        sent = min(sent + chunk, len(view))
+        if progress is not None:
+            progress(sent)
+    rig.flush()
+    return sent
+
+
+def sync(rig, unsolicited=None):
+    """ FA; round trip, the replies still due for the commands written before it are dropped
+
+    A set command the radio rejects answers "?;", which would otherwise be
+    taken for the reply of the next query. Other frames are given to
+    `unsolicited` when it is set.
+    """
+    rig.write(b"FA;")
+    while True:
+        resp = rig.read_until(b";")
+        if not resp.endswith(b";"):
+            return False
+        if FA_REPLY.match(resp):
+            return True
+        if resp != b"?;" and unsolicited is not None:
+            unsolicited(resp)
+
+
+def verify_frames(rig, frames, window=CAT_WINDOW, retries=VERIFY_RETRIES, cancel=None,
+                  unsolicited=None):
+    """ Read back EX set commands, write again the ones the radio did not take
+
+    All the menus are queried in one pipelined pass, then only the
+    mismatches are written and read again, up to `retries` times. Returns
+    a dict keyed by the set command: the last reply read for it, the
+    command was applied when the reply equals it (b"" if never read).
+    """
+    readback = {}
+    pending = [frame for frame in frames if frame.startswith(b"EX")]
+    for attempt in range(retries + 1):
+        if attempt:
+            write_frames(rig, b"".join(pending), cancel=cancel)
+        if not sync(rig, unsolicited):
+            break
+        replies, _ = read_menus(rig, [frame[:6] + b";" for frame in pending],
+                                window=window, cancel=cancel, unsolicited=unsolicited)
+        for frame in pending:
+            readback[frame] = replies.get(frame[:6] + b";", b"")
+        pending = [frame for frame in pending if readback[frame] != frame]
+        if not pending or (cancel is not None and cancel.is_set()):
+            break
+    return readback
+
+
+def read_meters(rig, queries, unsolicited=None):
+    """ RM queries written in one burst, returns the 0-255 readings in their order
+
+    A meter that does not answer before the timeout reads None. Replies
+    are matched on their RMn prefix, a stray "?;" is skipped and the
+    other frames are given to `unsolicited` when it is set.
+    """
+    rig.write(b"".join(queries))
+    pending = {query[:3]: index for index, query in enumerate(queries)}
+    readings = [None] * len(queries)
+    while pending:
+        resp = rig.read_until(b";")
+        if not resp.endswith(b";"):
+            break
+        index = pending.pop(resp[:3], None)
+        if index is not None:
+            readings[index] = int(resp[3:6])
+        elif resp != b"?;" and unsolicited is not None:
+            unsolicited(resp)
+    return readings
+
+
+def set_function(rig, frame, query, unsolicited=None):
+    """ Set command and the query of its state written together, one round trip
+
+    Returns (accepted, reply): the set command was rejected when a "?;"
+    comes before the reply of the query, reply is b"" when the radio did
+    not answer. Other frames are given to `unsolicited` when it is set.
+    """
+    rig.write(frame + query)
+    key = frame_key(query)
+    accepted = True
+    while True:
+        resp = rig.read_until(b";")
+        if not resp.endswith(b";"):
+            return False, b""
+        if resp == b"?;":
+            accepted = False
+        elif frame_key(resp) == key:
+            return accepted, resp
+        elif unsolicited is not None:
+            unsolicited(resp)
+
+
+def auto_info(frame):
+    """ VFO state carried by a FA, FB, MD or IF frame: {"FA": 14074000, "MD": "USB"} """
+    name = frame[:2]
+    try:
+        if name in (b"FA", b"FB") and len(frame) == 12:
+            return {name.decode(ENCODER): int(frame[2:11])}
+        if name == b"MD" and len(frame) == 5:
+            return {"MD": MODE_NAMES.get(frame[3:4], frame[3:4].decode(ENCODER))}
+        if name == b"IF" and len(frame) >= 23:
+            return {"FA": int(frame[5:14]),
+                    "MD": MODE_NAMES.get(frame[21:22], frame[21:22].decode(ENCODER))}
+    except (ValueError, UnicodeDecodeError):
+        pass
+    return {}
+
+
+def split_frames(buffer):
+    """ b"EX01010300;EX0102" -> [b"EX01010300;"], an unfinished frame is dropped """
+    return [frame + b";" for frame in buffer.split(b";")[:-1]]
+
+
+def frame_key(frame):
+    """ What a set command overwrites in the radio, b"EX0101", b"CO02" (APF), b"MT001" or b"FA" """
+    if frame.startswith(b"EX"):
+        return frame[:6]
+    if frame[:2] in MEMORY_COMMANDS:
+        return frame[:5]
+    for key in FUNCTION_KEYS.get(frame[:2], ()):
+        if frame.startswith(key):
+            return key
+    return frame[:2]
+
+
+def menu_of(frame):
+    """ Menu number and value of an EX frame, b"EX01010300;" -> ("0101", b"0300") """
+    return frame[2:6].decode(ENCODER), frame[6:-1]
+
+
+def changed_frames(frames, snapshot):
+    """ Keep the set commands whose value differs from the radio snapshot """
+    return [frame for frame in frames
+            if snapshot.get(frame[2:6].decode(ENCODER)) != frame[6:-1]]
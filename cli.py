@@ -0,0 +1,361 @@
+##########################################################################
+#         Command line push / pull / diff of the menu (no Qt here)       #
+##########################################################################
+"""
+Scripted config transfers, for cron jobs and remote stations without a
+display. The config files are the JSON files of "Save config":
+
+    python3 cli.py pull station.json
+    python3 cli.py push station.json --changes
+    python3 cli.py diff station.json            (file against the radio)
+    python3 cli.py diff station.json other.json (file against file)
+    python3 cli.py mem-pull channels.csv [--chirp]
+    python3 cli.py mem-push channels.csv        (CPyS-891 or CHIRP CSV)
+
+The port comes from CPyS.cfg unless --port is given. Several --port run
+the same command on a fleet of radios, one thread per port, pull then
+and mem-pull save one file per radio (station-ttyUSB0.json). mem-push
+only writes the channels that differ from the radio. Exit status: 0 when
+done, 1 when a radio is not found, a menu or a channel was not applied
+or diff found differences, 2 on a bad command line, config or channel
+file.
+"""
+import os
+import re
+import sys
+import json
+import time
+import platform
+import argparse
+import threading
+import configparser
+
+import serial
+
+from cat import (new_port, detect_baudrate, discover_port, remember_port, read_menus,
+                 write_frames, verify_frames, sync, menu_of)
+from const import ENCODER, COMBO, BAUDRATE, MENU_PARAMS, MENU_BY_NAME, MENU_BY_CODE, MENU_QUERIES, MEMORY_QUERIES
+from memory import MemoryTable, NATIVE, CHIRP, RowError, read_channels, write_channels, import_channels
+
+
+class ConfigError(Exception):
+    """ Config file that cannot be sent to the radio """
+
+
+def load_config(path):
+    """ {code: value} of the menus in a config file, checked against their range """
+    try:
+        with open(path, "r") as file:
+            menu = json.load(file)["Menu"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ConfigError(f"{path}: not a CPyS-891 config file ({e})")
+
+    values = {}
+    errors = []
+    for name, value in menu.items():
+        param = MENU_BY_NAME.get(name)
+        if param is None:
+            errors.append(f"unknown menu {name!r}")
+        elif not param.accepts(value):
+            if param.kind == COMBO:
+                errors.append(f"{param.number} {name}: {value!r} is not one of {', '.join(param.table)}")
+            else:
+                errors.append(f"{param.number} {name}: {value!r} is not in {param.minimum}..{param.maximum}")
+        else:
+            # The value the radio will really have
+            values[param.code] = param.decode(param.encode(value))
+    if errors:
+        raise ConfigError(f"{path}: " + "; ".join(errors))
+    return values
+
+
+def check_channels(path):
+    """ Read a channel file once, every row the radio cannot take is reported """
+    errors = []
+    try:
+        with open(path, "r", newline="") as file:
+            for _ in read_channels(file, errors):
+                pass
+    except (OSError, UnicodeDecodeError, RowError) as e:
+        raise ConfigError(f"{path}: {e}")
+    if errors:
+        raise ConfigError("\n".join(f"{path}: {error}" for error in errors))
+
+
+def save_config(path, values):
+    """ Config file in the format of "Save config" """
+    config_dict = {
+        "Menu": {param.name: values[param.code] for param in MENU_PARAMS if param.code in values},
+        "Functions": {}
+    }
+    with open(path, "w") as file:
+        json.dump(config_dict, file,
+                  indent=4,
+                  sort_keys=False,
+                  ensure_ascii=False)
+
+
+def open_rig(port, rates, auto_detect):
+    """ Open port on the FT-891, or None """
+    if auto_detect and not port.startswith("ft891://"):
+        found = discover_port(port, rates)
+        if found is not None:
+            port, rates = found[0], [found[1]]
+
+    rig = new_port(port, baudrate=int(rates[0]), bytesize=8, timeout=0.1,
+                   stopbits=serial.STOPBITS_ONE, rtscts=True)
+    try:
+        rig.port = port
+        rig.open()
+        baudrate = detect_baudrate(rig, rates)
+    except (serial.SerialException, OSError):
+        baudrate = None
+    if baudrate is None:
+        if rig.is_open:
+            rig.close()
+        return None
+    remember_port(port, baudrate)
+    return rig
+
+
+def read_radio(rig):
+    """ {code: value} of every menu the radio answered """
+    replies, _ = read_menus(rig, MENU_QUERIES)
+    values = {}
+    for param in MENU_PARAMS:
+        resp = replies.get(param.query)
+        value = param.value_of(resp) if resp is not None and resp[:6] == param.prefix else None
+        if value is not None:
+            values[param.code] = value
+    return values
+
+
+def read_memory(rig):
+    """ MemoryTable of the channels stored in the radio """
+    table = MemoryTable()
+    replies, _ = read_menus(rig, MEMORY_QUERIES)
+    table.load(replies)
+    return table
+
+
+def text(param, value):
+    if param.kind == COMBO:
+        return value
+    return f"{value}{param.suffix}"
+
+
+def pull(rig, args, log):
+    """ Radio -> file """
+    values = read_radio(rig)
+    save_config(args.file, values)
+    log(f"{len(values)} parameters saved in {args.file}")
+    return 0 if len(values) == len(MENU_PARAMS) else 1
+
+
+def push(rig, args, log):
+    """ File -> radio, optionally only the changes, then read back """
+    values = load_config(args.file)
+    if args.changes:
+        radio = read_radio(rig)
+        values = {code: value for code, value in values.items() if radio.get(code) != value}
+    frames = [MENU_BY_CODE[code].encode(value) for code, value in values.items()
+              if MENU_BY_CODE[code].writable]
+
+    write_frames(rig, b"".join(frames))
+    if not args.verify:
+        log(f"{len(frames)} parameters sent")
+        return 0
+
+    readback = verify_frames(rig, frames)
+    rejected = [frame for frame, resp in readback.items() if resp != frame]
+    for frame in rejected:
+        param = MENU_BY_CODE[menu_of(frame)[0]]
+        resp = readback[frame]
+        value = param.value_of(resp) if resp[:6] == param.prefix else None
+        if value is not None:
+            now = text(param, value)
+        else:
+            now = resp.decode(ENCODER, "replace") if resp else "no answer"
+        log(f"{param.number} {param.name}: not applied, the FT-891 has {now}", error=True)
+    log(f"{len(frames)} parameters sent, {len(frames) - len(rejected)} verified")
+    return 1 if rejected else 0
+
+
+def diff(rig, args, log):
+    """ File against the radio, or against another file """
+    values = load_config(args.file)
+    if args.other is not None:
+        other, where = load_config(args.other), args.other
+    else:
+        other, where = read_radio(rig), "FT-891"
+
+    found = 0
+    for param in MENU_PARAMS:
+        mine, theirs = values.get(param.code), other.get(param.code)
+        if mine is None or theirs is None or mine == theirs:
+            continue
+        found += 1
+        log(f"{param.number} {param.name}: {args.file} {text(param, mine)}, "
+            f"{where} {text(param, theirs)}")
+    return 1 if found else 0
+
+
+def mem_pull(rig, args, log):
+    """ Radio memory -> channel file """
+    table = read_memory(rig)
+    with open(args.file, "w", newline="") as file:
+        count = write_channels(file, table, CHIRP if args.chirp else NATIVE)
+    log(f"{count} memory channels saved in {args.file}")
+    return 0
+
+
+def mem_push(rig, args, log):
+    """ Channel file -> radio memory, only the channels that differ, then read back """
+    table = read_memory(rig)
+    with open(args.file, "r", newline="") as file:
+        rows = import_channels(table, read_channels(file))
+    frames = table.frames(rows)
+    write_frames(rig, b"".join(frames))
+
+    # The "?;" of the channels not taken are dropped before the read-back
+    replies = {}
+    if sync(rig):
+        replies, _ = read_menus(rig, table.queries(rows))
+    table.load(replies, keep=True)
+    rejected = [row for row in rows if table.changed(row)]
+    for row in rejected:
+        log(f"channel {table.channels[row]}: not applied", error=True)
+    log(f"{len(frames)} memory channels written, {len(frames) - len(rejected)} verified")
+    return 1 if rejected else 0
+
+
+def console(message, error=False):
+    print(message, file=sys.stderr if error else sys.stdout)
+
+
+def run(port, args, rates, discover, log=console):
+    """ Command on the radio of one port, returns the exit status """
+    rig = open_rig(port, rates, discover)
+    if rig is None:
+        log("FT-891 not found", error=True)
+        return 1
+    try:
+        return args.run(rig, args, log)
+    except (serial.SerialException, OSError) as e:
+        log(str(e), error=True)
+        return 1
+    finally:
+        rig.close()
+
+
+def fleet_path(path, port):
+    """ station.json -> station-ttyUSB0.json, the file of one radio of the fleet """
+    root, ext = os.path.splitext(path)
+    name = re.sub(r"[^\w.-]", "_", port.rstrip("/").rsplit("/", 1)[-1])
+    return f"{root}-{name}{ext or '.json'}"
+
+
+def run_fleet(ports, args, rates):
+    """ Same command on every radio at once, one thread per port
+
+    The ports are given, they are not discovered: each radio keeps its own
+    port. Returns the worst exit status.
+    """
+    import concurrent.futures
+
+    lock = threading.Lock()
+
+    def job(port):
+        def log(message, error=False):
+            with lock:
+                console(f"{port}: {message}", error)
+
+        rig_args = argparse.Namespace(**vars(args))
+        if args.command in ("pull", "mem-pull"):
+            rig_args.file = fleet_path(args.file, port)
+        start = time.perf_counter()
+        status = run(port, rig_args, rates, False, log)
+        return status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(ports)) as pool:
+        results = dict(zip(ports, pool.map(job, ports)))
+    elapsed = time.perf_counter() - start
+
+    width = max(len(port) for port in ports)
+    for port, (status, rig_elapsed) in results.items():
+        print(f"{port:<{width}}  {'ok' if status == 0 else 'FAILED':<6}  {rig_elapsed:6.2f} s")
+    failed = sum(1 for status, _ in results.values() if status)
+    print(f"{len(ports)} radios, {failed} failed, {elapsed:.2f} s")
+    return max(status for status, _ in results.values())
+
+
+def main(argv=None):
+    config = configparser.ConfigParser()
+    config.read("./CPyS.cfg")
+    default = config["DEFAULT"]
+    port = default.get("windows_port" if platform.system() == "Windows" else "linux_port", "")
+
+    parser = argparse.ArgumentParser(prog="cli.py", description="CPyS-891 without the window")
+    parser.add_argument("--port", action="append",
+                        help="serial port or ft891:// simulator URL, several for a fleet")
+    parser.add_argument("--baudrate", default=default.get("baudrate", "9600"),
+                        choices=BAUDRATE, help="CAT RATE tried first")
+    parser.add_argument("--auto-detect", choices=("on", "off"), default=default.get("auto_detect", "off"),
+                        help="probe the other CAT RATEs and serial ports")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cmd = commands.add_parser("pull", help="save the menu of the radio in a config file")
+    cmd.add_argument("file")
+    cmd.set_defaults(run=pull)
+
+    cmd = commands.add_parser("push", help="send a config file to the radio")
+    cmd.add_argument("file")
+    cmd.add_argument("--changes", action="store_true",
+                     help="read the radio first and send only what differs")
+    cmd.add_argument("--verify", choices=("on", "off"), default=default.get("verify_send", "on"),
+                     help="read back the menus sent and write again the ones not applied")
+    cmd.set_defaults(run=push)
+
+    cmd = commands.add_parser("diff", help="compare a config file with the radio or another file")
+    cmd.add_argument("file")
+    cmd.add_argument("other", nargs="?")
+    cmd.set_defaults(run=diff)
+
+    cmd = commands.add_parser("mem-pull", help="save the memory channels of the radio in a CSV file")
+    cmd.add_argument("file")
+    cmd.add_argument("--chirp", action="store_true", help="CHIRP layout")
+    cmd.set_defaults(run=mem_pull)
+
+    cmd = commands.add_parser("mem-push", help="write the channels of a CSV file that differ from the radio")
+    cmd.add_argument("file")
+    cmd.set_defaults(run=mem_push)
+
+    args = parser.parse_args(argv)
+    ports = list(dict.fromkeys(name.strip() for names in args.port or [port]
+                               for name in names.split(",") if name.strip()))
+    if args.command == "push":
+        args.verify = args.verify == "on"
+
+    try:
+        # A config file error is better found before opening the port
+        if args.command in ("push", "diff"):
+            load_config(args.file)
+        elif args.command == "mem-push":
+            check_channels(args.file)
+        if args.command == "diff" and args.other is not None:
+            return diff(None, args, console)
+    except ConfigError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    rates = [args.baudrate]
+    if args.auto_detect == "on":
+        rates += [rate for rate in BAUDRATE if rate != args.baudrate]
+    if len(ports) > 1:
+        return run_fleet(ports, args, rates)
+    return run(ports[0], args, rates, args.auto_detect == "on")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
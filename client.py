@@ -0,0 +1,302 @@
+##########################################################################
+#          asyncio CAT client for the Yaesu FT-891 (no Qt here)          #
+##########################################################################
+"""
+Awaitable menu access for scripts and automation:
+
+    async with await open_client("/dev/ttyUSB0", 38400) as rig:
+        delay = await rig.get("AGC FAST DELAY")
+        await rig.set("0101", 1000)
+        values = await rig.get_many(MENU_PARAMS)
+        rejected = await rig.set_many({"LCD CONTRAST": 10, "0506": "38400 bps"})
+
+Menus are given by code ("0101"), name or MenuParam. The port can be a
+serial port, the "ft891://" simulator or "socket://host:port" (ser2net or
+a remote station). Any pair of asyncio streams works too:
+FT891Client(reader, writer).
+
+The FT-891 answers in the order of the commands, so the replies are
+matched to the commands first in, first out: a "?;" is the error of the
+oldest command still waiting, and a set command, which has no reply, is
+accepted once a later command is answered. Every set command is followed
+by the query of its value, so the set command still waiting when a "?;"
+comes is the one the radio refused.
+"""
+import asyncio
+import threading
+import collections
+import concurrent.futures
+
+from cat import new_port, frame_key
+from const import ENCODER, CAT_WINDOW, MENU_BY_CODE, MENU_BY_NAME, MenuParam
+
+# Seconds to wait for the reply of a query
+REPLY_TIMEOUT = 1.
+
+
+class CatError(Exception):
+    """ Command rejected ("?;") or not answered by the FT-891 """
+
+
+def menu_param(menu):
+    """ MenuParam of a code, a name or a MenuParam """
+    if isinstance(menu, MenuParam):
+        return menu
+    param = MENU_BY_CODE.get(menu) or MENU_BY_NAME.get(menu)
+    if param is None:
+        raise KeyError(f"unknown menu {menu!r}")
+    return param
+
+
+class Command:
+    """ A command waiting in the matcher, a query expects a reply with its key """
+
+    def __init__(self, frame, query, future):
+        self.frame = frame
+        self.key = frame_key(frame)
+        self.query = query
+        self.future = future
+
+
+class FT891Client:
+    """ Concurrency safe CAT client over asyncio streams """
+
+    def __init__(self, reader, writer, window=CAT_WINDOW, timeout=REPLY_TIMEOUT, unsolicited=None):
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+        # Called with the frames nobody asked for (Auto Information)
+        self.unsolicited = unsolicited
+        self.window = asyncio.Semaphore(window)
+        self.waiting = collections.deque()
+        self.reading = asyncio.ensure_future(self.read_replies())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        self.reading.cancel()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (OSError, ConnectionError):
+            pass
+        self.fail_all(CatError("client closed"))
+
+    # ###### Matcher
+
+    async def read_replies(self):
+        """ Give each reply to its command, for as long as the stream is open """
+        try:
+            while True:
+                self.dispatch(await self.reader.readuntil(b";"))
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
+            self.fail_all(CatError(f"connection lost: {e}"))
+
+    def dispatch(self, reply):
+        while self.waiting and self.waiting[0].future.done():
+            # Timed out or cancelled by its caller
+            self.waiting.popleft()
+
+        if reply == b"?;":
+            if self.waiting:
+                command = self.waiting.popleft()
+                command.future.set_exception(CatError(f"{command.frame.decode()} rejected"))
+            return
+
+        key = frame_key(reply)
+        for position, command in enumerate(self.waiting):
+            if command.query and command.key == key and not command.future.done():
+                break
+        else:
+            if self.unsolicited is not None:
+                self.unsolicited(reply)
+            return
+
+        # Everything before the query has been taken by the radio
+        for _ in range(position):
+            earlier = self.waiting.popleft()
+            if earlier.future.done():
+                continue
+            if earlier.query:
+                earlier.future.set_exception(CatError(f"{earlier.frame.decode()} not answered"))
+            else:
+                earlier.future.set_result(None)
+        self.waiting.popleft().future.set_result(reply)
+
+    def fail_all(self, error):
+        while self.waiting:
+            command = self.waiting.popleft()
+            if not command.future.done():
+                command.future.set_exception(error)
+
+    def submit(self, frame, query):
+        """ Write a command, its future gets the reply, or None for a set command """
+        command = Command(frame, query, asyncio.get_running_loop().create_future())
+        self.waiting.append(command)
+        self.writer.write(frame)
+        return command.future
+
+    # ###### Raw commands
+
+    async def query(self, frame):
+        """ b"FA;" -> b"FA014074000;" """
+        async with self.window:
+            future = self.submit(frame, True)
+            await self.writer.drain()
+            try:
+                return await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                raise CatError(f"{frame.decode()} not answered")
+
+    async def send(self, frames):
+        """ Set commands, returns {frame: None or the CatError of the radio}
+
+        Each one is followed by the query of its value, as set_function does:
+        a "?;" is the error of the set command of the reply it comes before.
+        """
+        futures = []
+        queries = []
+        for frame in frames:
+            futures.append(self.submit(frame, False))
+            queries.append(self.submit(frame_key(frame) + b";", True))
+        await self.writer.drain()
+        pending = set(queries)
+        while pending:
+            # Time out when the radio stops answering, not on a long batch
+            done, pending = await asyncio.wait(pending, timeout=self.timeout)
+            if not done:
+                break
+        for query in queries:
+            if not query.done():
+                query.cancel()
+            elif not query.cancelled():
+                query.exception()
+        results = {}
+        for frame, future in zip(frames, futures):
+            if not future.done():
+                future.cancel()
+                results[frame] = CatError(f"{frame.decode()} not acknowledged")
+            else:
+                results[frame] = future.exception()
+        return results
+
+    # ###### Menus
+
+    async def get(self, menu):
+        """ Value of a menu, as the table shows it """
+        param = menu_param(menu)
+        reply = await self.query(param.query)
+        value = param.value_of(reply)
+        if value is None:
+            raise CatError(f"{param.number} {param.name}: unknown value {reply.decode(ENCODER, 'replace')}")
+        return value
+
+    async def get_many(self, menus):
+        """ {code: value}, the queries are pipelined up to the window """
+        params = [menu_param(menu) for menu in menus]
+        replies = await asyncio.gather(*(self.query(param.query) for param in params),
+                                       return_exceptions=True)
+        values = {param.code: param.value_of(reply) for param, reply in zip(params, replies)
+                  if not isinstance(reply, Exception)}
+        return {code: value for code, value in values.items() if value is not None}
+
+    async def set(self, menu, value):
+        """ Set a menu, CatError if the radio does not take it """
+        param = menu_param(menu)
+        errors = await self.set_many({param: value})
+        if errors:
+            raise errors[param.code]
+
+    async def set_many(self, values):
+        """ Set several menus in one batch, returns {code: CatError} of the rejected ones """
+        params = {}
+        for menu, value in values.items():
+            param = menu_param(menu)
+            if not param.writable:
+                raise ValueError(f"{param.number} {param.name} is read only")
+            if not param.accepts(value):
+                raise ValueError(f"{param.number} {param.name}: {value!r} out of range")
+            params[param.encode(value)] = param
+        results = await self.send(list(params))
+        return {params[frame].code: error for frame, error in results.items() if error is not None}
+
+    async def probe(self):
+        """ True if an FT-891 answers the FA; handshake """
+        try:
+            return (await self.query(b"FA;")).startswith(b"FA")
+        except CatError:
+            return False
+
+
+class PortWriter:
+    """ StreamWriter-like writer of a pyserial port, written by one thread in order """
+
+    def __init__(self, rig, stop):
+        self.rig = rig
+        self.stop = stop
+        self.buffer = bytearray()
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def write(self, data):
+        self.buffer += data
+
+    async def drain(self):
+        data, self.buffer = bytes(self.buffer), bytearray()
+        if data:
+            await asyncio.get_running_loop().run_in_executor(self.pool, self.rig.write, data)
+
+    def close(self):
+        self.stop.set()
+        self.pool.shutdown(wait=False)
+
+    async def wait_closed(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.rig.close)
+
+
+def pump_port(rig, loop):
+    """ asyncio streams over a blocking pyserial port, a thread feeds the reader """
+    reader = asyncio.StreamReader()
+    stop = threading.Event()
+
+    def feed():
+        try:
+            while not stop.is_set():
+                data = rig.read(max(1, rig.in_waiting))
+                if data:
+                    loop.call_soon_threadsafe(reader.feed_data, data)
+            loop.call_soon_threadsafe(reader.feed_eof)
+        except (OSError, ValueError, TypeError, RuntimeError):
+            # Port closed under the read, or the event loop already closed
+            pass
+
+    threading.Thread(target=feed, name=f"{rig.port} reader", daemon=True).start()
+    return reader, PortWriter(rig, stop)
+
+
+async def open_client(port, baudrate=9600, **kwargs):
+    """ FT891Client on a serial port, "ft891://" or "socket://host:port" """
+    if port.startswith("socket://"):
+        host, _, tcp_port = port[len("socket://"):].partition(":")
+        reader, writer = await asyncio.open_connection(host, int(tcp_port))
+        return FT891Client(reader, writer, **kwargs)
+
+    if not port.startswith("ft891://"):
+        try:
+            # Optional, pyserial-asyncio needs no thread
+            import serial_asyncio
+        except ImportError:
+            pass
+        else:
+            reader, writer = await serial_asyncio.open_serial_connection(
+                url=port, baudrate=baudrate, rtscts=True)
+            return FT891Client(reader, writer, **kwargs)
+
+    rig = new_port(port, baudrate=baudrate, timeout=0.1, rtscts=True)
+    rig.port = port
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, rig.open)
+    return FT891Client(*pump_port(rig, loop), **kwargs)
@@ -1,5 +1,3 @@
-from PyQt5.Qt import *
-
 #########################################################################
 #                             General
 #########################################################################
@@ -11,6 +9,41 @@ FONT = "./fonts/Quicksand-Regular.ttf"
 FONT_FAMILY = "Quicksand"
 FONT_SIZE = 11
 ENCODER = "ascii"
+# Number of EX queries kept in flight by the pipelined read
+CAT_WINDOW = 8
+# Bytes written at once by the batched send, RTS/CTS paces the rest
+CAT_CHUNK = 128
+# Live Mode coalescing window in msec, only the last value of each menu is sent
+LIVE_DEBOUNCE = 100
+# Port discovery: FA; probe timeout per baudrate and overall deadline in seconds
+PROBE_TIMEOUT = 0.05
+PROBE_DEADLINE = 1.0
+# Ports probed at once, and the USB bridge (VID, PID) inside the FT-891 (CP2105)
+PROBE_POOL = 4
+FT891_USB = (0x10C4, 0xEA70)
+# Ports and baudrates that answered as an FT-891, keyed by USB serial number
+PORT_CACHE = "./CPyS_ports.json"
+# Seconds the FT-891 takes to switch its CAT RATE after EX0506
+RATE_SETTLE = 0.1
+# Connection retries in seconds, doubled after each failure up to the maximum
+CONNECT_RETRY = 0.5
+CONNECT_RETRY_MAX = 30.
+# Seconds between two FA; link checks, they also acknowledge the set commands
+HEARTBEAT = 1.
+# Actions, not values: never replayed after a reconnection (EX1701 RESET)
+ONE_SHOT = (b"EX1701",)
+# Times a set command is written again when the read-back differs
+VERIFY_RETRIES = 2
+# Meter panel: polls per second of every meter and samples kept per graph
+METER_RATE = 20
+METER_HISTORY = 200
+# Auto Information: msec between two looks at the input buffer, local, no CAT traffic
+AI_POLL = 5
+# rigctld server: TCP port (hamlib default), seconds a reply is reused for the
+# other clients and seconds a client waits for the CAT link
+RIGCTL_PORT = 4532
+RIGCTL_CACHE = 0.2
+RIGCTL_TIMEOUT = 3.
 
 #########################################################################
 #                               Menu
@@ -157,13 +190,391 @@ CTCSS_STATE = {"CTCSS OFF": b"0", "CTCSS ENC/DEC": b"1",
 RPT_SHIFT_DIR = {"Simplex": b"0", "Plus Shift": b"1",
                  "Minus Shift": b"2"}
 TAG_STATE = {"TAG OFF": b"0", "TAG ON": b"1"}
+# RM meter number, the reply is RMn + 000 to 255
+METERS = {"S": b"1", "COMP": b"3", "ALC": b"4", "PO": b"5", "SWR": b"6", "ID": b"7"}
+METER_QUERIES = tuple(b"RM" + meter + b";" for meter in METERS.values())
+# Memory channels 001-099, the PMS band edges P1L-P9U and the 5 MHz channels 501-510
+MEMORY_CHANNELS = (tuple(f"{number:03d}" for number in range(1, 100)) +
+                   tuple(f"P{number}{edge}" for number in range(1, 10) for edge in "LU") +
+                   tuple(f"5{number:02d}" for number in range(1, 11)))
+# The MT reply holds the MR fields and the tag, one query per channel
+MEMORY_QUERIES = tuple(b"MT" + bytes(channel, ENCODER) + b";" for channel in MEMORY_CHANNELS)
+# Commands keyed by their channel, b"MT001"
+MEMORY_COMMANDS = (b"MR", b"MW", b"MT")
 
 #########################################################################
-#                               Function
+#                           Menu registry
 #########################################################################
+NUMBER = "number"  # zero padded integer, "0300"
+SIGNED = "signed"  # signed and zero padded integer, "+05"
+WEIGHT = "weight"  # one decimal float sent without the dot, 3.0 -> "30"
+BEACON = "beacon"  # seconds, above 240 sec the rig counts in 30 sec steps
+COMBO = "combo"  # text of a lookup table
+
+
+class FrameCache(dict):
+    """ Lazily filled table, a missing key is built once by `build` then kept """
+
+    __slots__ = ("build",)
+
+    def __init__(self, build):
+        super().__init__()
+        self.build = build
+
+    def __missing__(self, key):
+        value = self[key] = self.build(key)
+        return value
+
+
+class MenuParam:
+    """ EX menu parameter with its precompiled encoder and decoder
+
+    encode and decode are plain dict lookups: the frame of each value and
+    the value of each reply are built the first time, then reused.
+    """
+
+    def __init__(self, code, name, kind,
+                 width=1, minimum=None, maximum=None, table=None, writable=True,
+                 default=0, step=1, suffix="", special="", label=None):
+        self.code = code
+        self.name = name
+        self.kind = kind
+        self.width = width
+        self.minimum = minimum
+        self.maximum = maximum
+        self.table = table
+        self.writable = writable
+
+        # Menu table display
+        self.default = default
+        self.step = step
+        self.suffix = suffix
+        self.special = special
+        self.label = label or name
+        self.number = f"{code[:2]}-{code[2:]}"
+
+        self.prefix = b"EX" + bytes(code, ENCODER)
+        self.query = self.prefix + b";"
+
+        if kind == COMBO:
+            # Forward and reverse maps are built once, here
+            self.frames = {text: self.prefix + value + b";" for text, value in table.items()}
+            self.texts = {value: text for text, value in table.items()}
+            self.replies = {frame: text for text, frame in self.frames.items()}
+        else:
+            sign = "+" if kind == SIGNED else ""
+            self.format = f"EX{code}%{sign}0{width}d;"
+            self.frames = FrameCache({NUMBER: self.encode_number,
+                                      SIGNED: self.encode_number,
+                                      WEIGHT: self.encode_weight,
+                                      BEACON: self.encode_beacon}[kind])
+            self.replies = FrameCache({NUMBER: self.decode_number,
+                                       SIGNED: self.decode_number,
+                                       WEIGHT: self.decode_weight,
+                                       BEACON: self.decode_beacon}[kind])
+        self.encode = self.frames.__getitem__
+        self.decode = self.replies.__getitem__
+
+    def value_of(self, resp):
+        """ decode() of a reply that may not be valid, None when it is not in the
+        table (other firmware) or not a number (truncated frame) """
+        try:
+            return self.decode(resp)
+        except (KeyError, ValueError):
+            return None
+
+    def accepts(self, value):
+        """ True if the value can be sent, a text of the table or a number in range """
+        if self.kind == COMBO:
+            return value in self.table
+        return (isinstance(value, (int, float)) and not isinstance(value, bool)
+                and self.minimum <= value <= self.maximum)
+
+    def encode_number(self, value):
+        return bytes(self.format % value, ENCODER)
+
+    def encode_weight(self, value):
+        return bytes(self.format % round(value * 10), ENCODER)
+
+    def encode_beacon(self, value):
+        if value > 240:
+            value = 240 + (value - 240) // 30
+        return bytes(self.format % value, ENCODER)
+
+    @staticmethod
+    def decode_number(resp):
+        return int(resp[6:-1])
+
+    @staticmethod
+    def decode_weight(resp):
+        return int(resp[6:-1]) / 10
+
+    @staticmethod
+    def decode_beacon(resp):
+        value = int(resp[6:-1])
+        if value > 240:
+            value = 240 + (value - 240) * 30
+        return value
+
+
+MENU_PARAMS = (
+    MenuParam("0101", "AGC FAST DELAY", NUMBER, 4, 20, 4000,
+              default=300, step=20, suffix=" msec", label="ACG FAST DELAY"),
+    MenuParam("0102", "AGC MID DELAY", NUMBER, 4, 20, 4000,
+              default=700, step=20, suffix=" msec", label="ACG MID DELAY"),
+    MenuParam("0103", "AGC SLOW DELAY", NUMBER, 4, 20, 4000,
+              default=3000, step=20, suffix=" msec", label="ACG SLOW DELAY"),
+    MenuParam("0201", "LCD CONTRAST", NUMBER, 2, 1, 15, default=8),
+    MenuParam("0202", "DIMMER BACKLIT", NUMBER, 2, 1, 15, default=8),
+    MenuParam("0203", "DIMMER LCD", NUMBER, 2, 1, 15, default=8),
+    MenuParam("0204", "DIMMER TX/BUSY", NUMBER, 2, 1, 15, default=8),
+    MenuParam("0205", "PEAK HOLD", COMBO, table=PEAK_HOLD, default="OFF"),
+    MenuParam("0206", "ZIN LED", COMBO, table=ZIN_LED, default="DISABLE"),
+    MenuParam("0207", "POP-UP MENU", COMBO, table=POPUP_MENU, default="LOWER"),
+    MenuParam("0301", "DVS RX OUT LVL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("0302", "DVS TX OUT LVL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("0401", "KEYER TYPE", COMBO, table=KEYER_TYPE, default="ELEKEY-B"),
+    MenuParam("0402", "KEYER DOT/DASH", COMBO, table=KEYER_DOT_DASH, default="NOR"),
+    MenuParam("0403", "CW WEIGHT", WEIGHT, 2, 2.5, 4.5, default=3.0, step=0.1),
+    MenuParam("0404", "BEACON INTERVAL", BEACON, 3, 0, 690, suffix=" sec", special="OFF"),
+    MenuParam("0405", "NUMBER STYLE", COMBO, table=NUMBER_STYLE, default="1290"),
+    MenuParam("0406", "CONTEST NUMBER", NUMBER, 4, 0, 9999, default=1),
+    MenuParam("0407", "CW MEMORY 1", COMBO, table=CW_MEMORY, default="TEXT"),
+    MenuParam("0408", "CW MEMORY 2", COMBO, table=CW_MEMORY, default="TEXT"),
+    MenuParam("0409", "CW MEMORY 3", COMBO, table=CW_MEMORY, default="TEXT"),
+    MenuParam("0410", "CW MEMORY 4", COMBO, table=CW_MEMORY, default="TEXT"),
+    MenuParam("0411", "CW MEMORY 5", COMBO, table=CW_MEMORY, default="TEXT"),
+    MenuParam("0501", "NB WIDTH", COMBO, table=NB_WIDHT, default="3 msec"),
+    MenuParam("0502", "NB REJECTION", COMBO, table=NB_REJECTION, default="30 dB"),
+    MenuParam("0503", "NB LEVEL", NUMBER, 2, 0, 10, default=5),
+    MenuParam("0504", "BEEP LEVEL", NUMBER, 3, 0, 100, default=30),
+    MenuParam("0505", "RF/SQL VR", COMBO, table=RF_SQL_VR, default="RF"),
+    MenuParam("0506", "CAT RATE", COMBO, table=CAT_RATE, writable=False, default="4800 bds"),
+    MenuParam("0507", "CAT TOT", COMBO, table=CAT_TOT, default="10 msec"),
+    MenuParam("0508", "CAT RTS", COMBO, table=CAT_RTS, default="ENABLE"),
+    MenuParam("0509", "MEM GROUP", COMBO, table=MEMORY_GROUP, default="DISABLE", label="MEMORY GROUP"),
+    MenuParam("0510", "FM SETTING", COMBO, table=FM_SETTING, default="DISABLE"),
+    MenuParam("0511", "REC SETTING", COMBO, table=REC_SETTING, default="DISABLE"),
+    MenuParam("0512", "ATAS SETTING", COMBO, table=ATAS_SETTING, default="DISABLE"),
+    MenuParam("0513", "QUICK SPL FREQ", SIGNED, 3, -20, 20, default=5, suffix=" kHz"),
+    MenuParam("0514", "TX TOT", NUMBER, 2, 0, 30, default=10, suffix=" min", special="OFF"),
+    MenuParam("0515", "MIC SCAN", COMBO, table=MIC_SCAN, default="ENABLE"),
+    MenuParam("0516", "MIC SCAN RESUME", COMBO, table=MIC_SCAN_RESUME, default="TIME"),
+    MenuParam("0517", "REF FREQ ADJ", SIGNED, 3, -25, 25),
+    MenuParam("0518", "CLAR SELECT", COMBO, table=CLAR_SELECT, default="RX"),
+    MenuParam("0519", "APO", COMBO, table=APO, default="OFF"),
+    MenuParam("0520", "FAN CONTROL", COMBO, table=FAN_CONTROL, default="NORMAL"),
+    MenuParam("0601", "AM LCUT FREQ", COMBO, table=LCUT_FREQ, default="OFF"),
+    MenuParam("0602", "AM LCUT SLOPE", COMBO, table=SLOPE, default="6 dB/oct"),
+    MenuParam("0603", "AM HCUT FREQ", COMBO, table=HCUT_FREQ, default="OFF"),
+    MenuParam("0604", "AM HCUT SLOPE", COMBO, table=SLOPE, default="6 dB/oct"),
+    MenuParam("0605", "AM MIC SELECT", COMBO, table=AM_MIC_SELECT, default="MIC"),
+    MenuParam("0606", "AM OUT LEVEL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("0607", "AM PTT SELECT", COMBO, table=AM_PTT_SELECT, default="DAKY"),
+    MenuParam("0701", "CW LCUT FREQ", COMBO, table=LCUT_FREQ, default="250 Hz"),
+    MenuParam("0702", "CW LCUT SLOPE", COMBO, table=SLOPE, default="18 dB/oct"),
+    MenuParam("0703", "CW HCUT FREQ", COMBO, table=HCUT_FREQ, default="1200 Hz"),
+    MenuParam("0704", "CW HCUT SLOPE", COMBO, table=SLOPE, default="18 dB/oct"),
+    MenuParam("0705", "CW OUT LEVEL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("0706", "CW AUTO MODE", COMBO, table=CW_AUTO_MODE, default="OFF"),
+    MenuParam("0707", "CW BFO", COMBO, table=CW_BFO, default="USB"),
+    MenuParam("0708", "CW BK-IN TYPE", COMBO, table=CW_BK_IN_TYPE, default="SEMI"),
+    MenuParam("0709", "CW BK-IN DELAY", NUMBER, 4, 30, 3000, default=200, step=10, suffix=" msec"),
+    MenuParam("0710", "CW WAVE SHAPE", COMBO, table=CW_WAVE_SHAPE, default="4 msec"),
+    MenuParam("0711", "CW FREQ DISPLAY", COMBO, table=CW_FREQ_DISPLAY, default="PITCH"),
+    MenuParam("0712", "PC KEYING", COMBO, table=PC_KEYING, default="OFF"),
+    MenuParam("0713", "QSK DELAY TIME", COMBO, table=QSK_DELAY_TIME, default="15 msec"),
+    MenuParam("0801", "DATA MODE", COMBO, table=DATA_MODE, default="PSK"),
+    MenuParam("0802", "PSK TONE", COMBO, table=PSK_TONE, default="1000 Hz"),
+    MenuParam("0803", "OTHER DISP", SIGNED, 5, -3000, 3000, step=10, suffix=" Hz"),
+    MenuParam("0804", "OTHER SHIFT", SIGNED, 5, -3000, 3000, step=10, suffix=" Hz"),
+    MenuParam("0805", "DATA LCUT FREQ", COMBO, table=LCUT_FREQ, default="300 Hz"),
+    MenuParam("0806", "DATA LCUT SLOPE", COMBO, table=SLOPE, default="18 dB/oct"),
+    MenuParam("0807", "DATA HCUT FREQ", COMBO, table=HCUT_FREQ, default="3000 Hz"),
+    MenuParam("0808", "DATA HCUT SLOPE", COMBO, table=SLOPE, default="18 dB/oct"),
+    MenuParam("0809", "DATA IN SELECT", COMBO, table=DATA_IN_SELECT, default="REAR"),
+    MenuParam("0810", "DATA PTT SELECT", COMBO, table=DATA_PTT_SELECT, default="DAKY"),
+    MenuParam("0811", "DATA OUT LEVEL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("0812", "DATA BFO", COMBO, table=DATA_BFO, default="LSB"),
+    MenuParam("0901", "FM MIC SELECT", COMBO, table=FM_MIC_SELECT, default="MIC"),
+    MenuParam("0902", "FM OUT LEVEL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("0903", "PKT PTT SELECT", COMBO, table=PKT_PTT_SELECT, default="DAKY"),
+    MenuParam("0904", "RPT SHIFT 28MHz", NUMBER, 4, 0, 1000,
+              default=100, step=10, suffix=" kHz", label="RPT SHIFT 28 MHz"),
+    MenuParam("0905", "RPT SHIFT 50MHz", NUMBER, 4, 0, 4000,
+              default=1000, step=10, suffix=" kHz", label="RPT SHIFT 50 MHz"),
+    MenuParam("0906", "DCS POLARITY", COMBO, table=DCS_POLARITY, default="Tn-Rn"),
+    MenuParam("1001", "RTTY LCUT FREQ", COMBO, table=LCUT_FREQ, default="300 Hz"),
+    MenuParam("1002", "RTTY LCUT SLOPE", COMBO, table=SLOPE, default="18 dB/oct"),
+    MenuParam("1003", "RTTY HCUT FREQ", COMBO, table=HCUT_FREQ, default="3000 Hz"),
+    MenuParam("1004", "RTTY HCUT SLOPE", COMBO, table=SLOPE, default="18 dB/oct"),
+    MenuParam("1005", "RTTY SHIFT PORT", COMBO, table=RTTY_SHIT_PORT, default="SHIFT"),
+    MenuParam("1006", "RTTY POLARITY-R", COMBO, table=RTTY_POLARITY, default="NOR"),
+    MenuParam("1007", "RTTY POLARITY-T", COMBO, table=RTTY_POLARITY, default="NOR"),
+    MenuParam("1008", "RTTY OUT LEVEL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1009", "RTTY SHIFT FREQ", COMBO, table=RTTY_SHIFT_FREQ, default="170 Hz"),
+    MenuParam("1010", "RTTY MARK FREQ", COMBO, table=RTTY_MARK_FREQ, default="2125 Hz"),
+    MenuParam("1011", "RTTY BFO", COMBO, table=RTTY_BFO, default="LSB"),
+    MenuParam("1101", "SSB LCUT FREQ", COMBO, table=LCUT_FREQ, default="100 Hz"),
+    MenuParam("1102", "SSB LCUT SLOPE", COMBO, table=SLOPE, default="6 dB/oct"),
+    MenuParam("1103", "SSB HCUT FREQ", COMBO, table=HCUT_FREQ, default="3000 Hz"),
+    MenuParam("1104", "SSB HCUT SLOPE", COMBO, table=SLOPE, default="6 dB/oct"),
+    MenuParam("1105", "SSB MIC SELECT", COMBO, table=SSB_MIC_SELECT, default="MIC"),
+    MenuParam("1106", "SSB OUT LEVEL", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1107", "SSB BFO", COMBO, table=SSB_BFO, default="AUTO"),
+    MenuParam("1108", "SSB PTT SELECT", COMBO, table=SSB_PTT_SELECT, default="DAKY"),
+    MenuParam("1109", "SSB TX BPF", COMBO, table=SSB_TX_BPF, default="300-2700"),
+    MenuParam("1201", "APF WIDTH", COMBO, table=APF_WIDTH, default="MEDIUM"),
+    MenuParam("1202", "CONTOUR LEVEL", SIGNED, 3, -40, 20, default=-15),
+    MenuParam("1203", "CONTOUR WIDTH", NUMBER, 2, 1, 11, default=10),
+    MenuParam("1204", "IF NOTCH WIDTH", COMBO, table=IF_NOTCH_WIDTH, default="WIDE"),
+    MenuParam("1301", "SCP START CYCLE", COMBO, table=SCP_START_CYCLE, default="OFF"),
+    MenuParam("1302", "SCP SPAN FREQ", COMBO, table=SCP_SPAN_FREQ, default="750 kHz"),
+    MenuParam("1401", "QUICK DIAL", COMBO, table=QUICK_DIAL, default="500 kHz"),
+    MenuParam("1402", "SSB DIAL STEP", COMBO, table=SSB_DIAL_STEP, default="10 Hz"),
+    MenuParam("1403", "AM DIAL STEP", COMBO, table=AM_DIAL_STEP, default="10 Hz"),
+    MenuParam("1404", "FM DIAL STEP", COMBO, table=FM_DIAL_STEP, default="100 Hz"),
+    MenuParam("1405", "DIAL STEP", COMBO, table=DIAL_STEP, default="5 Hz"),
+    MenuParam("1406", "AM CH STEP", COMBO, table=AM_CH_STEP, default="5 kHz"),
+    MenuParam("1407", "FM CH STEP", COMBO, table=FM_CH_STEP, default="5 kHz"),
+    MenuParam("1501", "EQ1 FREQ", COMBO, table=EQ_1_FREQ, default="OFF"),
+    MenuParam("1502", "EQ1 LEVEL", SIGNED, 3, -20, 10, default=5),
+    MenuParam("1503", "EQ1 BWTH", NUMBER, 2, 1, 10, default=10),
+    MenuParam("1504", "EQ2 FREQ", COMBO, table=EQ_2_FREQ, default="OFF"),
+    MenuParam("1505", "EQ2 LEVEL", SIGNED, 3, -20, 10, default=5),
+    MenuParam("1506", "EQ2 BWTH", NUMBER, 2, 1, 10, default=10),
+    MenuParam("1507", "EQ3 FREQ", COMBO, table=EQ_3_FREQ, default="OFF"),
+    MenuParam("1508", "EQ3 LEVEL", SIGNED, 3, -20, 10, default=5),
+    MenuParam("1509", "EQ3 BWTH", NUMBER, 2, 1, 10, default=10),
+    MenuParam("1510", "P-EQ1 FREQ", COMBO, table=EQ_1_FREQ, default="200 Hz"),
+    MenuParam("1511", "P-EQ1 LEVEL", SIGNED, 3, -20, 10),
+    MenuParam("1512", "P-EQ1 BWTH", NUMBER, 2, 1, 10, default=2),
+    MenuParam("1513", "P-EQ2 FREQ", COMBO, table=EQ_2_FREQ, default="800 Hz"),
+    MenuParam("1514", "P-EQ2 LEVEL", SIGNED, 3, -20, 10),
+    MenuParam("1515", "P-EQ2 BWTH", NUMBER, 2, 1, 10, default=1),
+    MenuParam("1516", "P-EQ3 FREQ", COMBO, table=EQ_3_FREQ, default="2100 Hz"),
+    MenuParam("1517", "P-EQ3 LEVEL", SIGNED, 3, -20, 10),
+    MenuParam("1518", "P-EQ3 BWTH", NUMBER, 2, 1, 10, default=1),
+    MenuParam("1601", "HF SSB PWR", NUMBER, 3, 5, 100, default=100),
+    MenuParam("1602", "HF AM PWR", NUMBER, 3, 5, 40, default=25),
+    MenuParam("1603", "HF PWR", NUMBER, 3, 5, 100, default=100),
+    MenuParam("1604", "50M SSB PWR", NUMBER, 3, 5, 100, default=100),
+    MenuParam("1605", "50M AM PWR", NUMBER, 3, 5, 40, default=25),
+    MenuParam("1606", "50M PWR", NUMBER, 3, 5, 100, default=100),
+    MenuParam("1607", "SSB MIC GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1608", "AM MIC GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1609", "FM MIC GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1610", "DATA MIC GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1611", "SSB DATA GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1612", "AM DATA GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1613", "FM DATA GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1614", "DATA DATA GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1615", "TUNER SELECT", COMBO, table=TUNER_SELECT, default="OFF"),
+    MenuParam("1616", "VOX SELECT", COMBO, table=VOX_SELECT, default="MIC"),
+    MenuParam("1617", "VOX GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1618", "VOX DELAY", NUMBER, 4, 30, 3000, default=500, step=10, suffix=" msec"),
+    MenuParam("1619", "ANTI VOX GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1620", "DATA VOX GAIN", NUMBER, 3, 0, 100, default=50),
+    MenuParam("1621", "DATA VOX DELAY", NUMBER, 4, 30, 3000, default=100, step=10, suffix=" msec"),
+    MenuParam("1622", "ANTI DVOX GAIN", NUMBER, 3, 0, 100),
+    MenuParam("1623", "EMERGENCY FREQ", COMBO, table=EMERGENCY_FREQ, default="DISABLE"),
+)
+# Title rows of the menu table, before the first parameter of each group
+MENU_SECTIONS = {"0101": "ACG", "0201": "DISPLAY", "0301": "DVS", "0401": "KEYER",
+                 "0501": "GENERAL", "0601": "MODE AM", "0701": "MODE CW", "0801": "MODE DAT",
+                 "0901": "MODE FM", "1001": "MODE RTY", "1101": "MODE SSB", "1201": "RX DSP",
+                 "1301": "SCOPE", "1401": "TUNING", "1501": "TX AUDIO", "1601": "TX GNRL"}
+MENU_BY_CODE = {param.code: param for param in MENU_PARAMS}
+MENU_BY_NAME = {param.name: param for param in MENU_PARAMS}
+MENU_QUERIES = tuple(param.query for param in MENU_PARAMS)
+
+#########################################################################
+#                         Function registry
+#########################################################################
+TOGGLE = "toggle"  # off / on, the button stays down when on
+CYCLE = "cycle"  # several states, each click goes to the next one
+MOMENTARY = "momentary"  # no state, the command is sent on each click
+PRESS = "PRESS"  # only state of a momentary function
+OFF_ON = {"OFF": b"0", "ON": b"1"}
+AGC = {"FAST": b"1", "MID": b"2", "SLOW": b"3", "AUTO": b"4"}
+
+
+class FunctionParam:
+    """ Front panel function with its precompiled set commands and replies
+
+    `key` is the command up to the state, b"VX" for the VOX, b"CO02" for
+    the APF. Like the combo menus, the frame of each state and the state
+    of each reply are built once, here.
+    """
+
+    def __init__(self, name, key, kind, table=None, aliases=None):
+        self.name = name
+        self.key = key
+        self.kind = kind
+        self.table = table or {PRESS: b""}
+        self.states = list(self.table)
+        self.query = key + b";"
+
+        self.frames = {state: key + value + b";" for state, value in self.table.items()}
+        self.replies = {frame: state for state, frame in self.frames.items()}
+        # Other replies of the query, AGC AUTO reads back as AUTO-FAST, -MID or -SLOW
+        for value, state in (aliases or {}).items():
+            self.replies[key + value + b";"] = state
+        self.encode = self.frames.__getitem__
+        # None for a reply that is not a state
+        self.decode = self.replies.get
+
+    def next_state(self, state):
+        """ State after a click, an unknown state counts as the first one """
+        position = self.states.index(state) if state in self.table else 0
+        return self.states[(position + 1) % len(self.states)]
+
+    def active(self, state):
+        return state is not None and state != self.states[0]
 
 
-def format_combo(combobox):
-    """ Center text in Combobox """
-    for i in range(0, combobox.count()):
-        combobox.setItemData(i, Qt.AlignCenter, Qt.TextAlignmentRole)
+FUNCTIONS = (
+    # Function 1
+    FunctionParam("TNR", b"AC", TOGGLE, {"OFF": b"000", "ON": b"001"}),
+    FunctionParam("VOX", b"VX", TOGGLE, OFF_ON),
+    FunctionParam("PRC", b"PR0", TOGGLE, OFF_ON),
+    FunctionParam("MON", b"ML0", TOGGLE, {"OFF": b"000", "ON": b"001"}),
+    FunctionParam("SPL", b"ST", TOGGLE, OFF_ON),
+    # PA0 0 is IPO, 1 the preamplifier
+    FunctionParam("IPO", b"PA0", TOGGLE, {"OFF": b"1", "ON": b"0"}),
+    FunctionParam("ATT", b"RA0", TOGGLE, OFF_ON),
+    FunctionParam("NAR", b"NA0", TOGGLE, OFF_ON),
+    FunctionParam("NB", b"NB0", TOGGLE, OFF_ON),
+    FunctionParam("NCH", b"BP00", TOGGLE, {"OFF": b"000", "ON": b"001"}),
+    # Function 2
+    FunctionParam("AGC", b"GT0", CYCLE, AGC, aliases={b"0": "OFF", b"5": "AUTO", b"6": "AUTO"}),
+    FunctionParam("DNR", b"NR0", TOGGLE, OFF_ON),
+    FunctionParam("DNF", b"BC0", TOGGLE, OFF_ON),
+    FunctionParam("CNT", b"CO00", TOGGLE, {"OFF": b"0000", "ON": b"0001"}),
+    FunctionParam("MOX", b"MX", TOGGLE, OFF_ON),
+    FunctionParam("TXW", b"TS", TOGGLE, OFF_ON),
+    FunctionParam("MEQ", b"PR1", TOGGLE, OFF_ON),
+    FunctionParam("QMB", b"QR", MOMENTARY),
+    # CW Setting
+    FunctionParam("ZIN", b"ZI", MOMENTARY),
+    FunctionParam("APF", b"CO02", TOGGLE, {"OFF": b"0000", "ON": b"0001"}),
+    FunctionParam("KEYER", b"KR", TOGGLE, OFF_ON),
+    FunctionParam("BK-IN", b"BI", TOGGLE, OFF_ON),
+    # FM Setting
+    FunctionParam("T/DCS", b"CT0", CYCLE, CTCSS_STATE),
+    FunctionParam("RPT", b"OS0", CYCLE, RPT_SHIFT_DIR),
+    # REC Setting, voice memory playback
+    FunctionParam("CH1", b"PB0", MOMENTARY, {PRESS: b"1"}),
+    FunctionParam("CH2", b"PB0", MOMENTARY, {PRESS: b"2"}),
+    FunctionParam("CH3", b"PB0", MOMENTARY, {PRESS: b"3"}),
+    FunctionParam("CH4", b"PB0", MOMENTARY, {PRESS: b"4"}),
+    FunctionParam("CH5", b"PB0", MOMENTARY, {PRESS: b"5"}),
+)
+FUNCTION_BY_NAME = {function.name: function for function in FUNCTIONS}
+# Functions with a state, by key, and the queries that read them
+FUNCTION_BY_KEY = {function.key: function for function in FUNCTIONS if function.kind != MOMENTARY}
+FUNCTION_QUERIES = tuple(function.query for function in FUNCTION_BY_KEY.values())
+# Keys of each two letter command, b"CO" -> (b"CO00", b"CO02")
+FUNCTION_KEYS = {command: tuple(dict.fromkeys(function.key for function in FUNCTIONS
+                                              if function.key[:2] == command))
+                 for command in dict.fromkeys(function.key[:2] for function in FUNCTIONS)}
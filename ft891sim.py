@@ -0,0 +1,430 @@
+##########################################################################
+#        FT-891 CAT simulator, usable without the radio (no Qt here)      #
+##########################################################################
+"""
+Two ways to use it:
+
+- as a pyserial port, put "ft891://" in CPyS.cfg instead of the COM port
+  or the /dev/ttyUSB. Options: ft891://name?rate=9600&pacing=on&latency=0
+  (a different name gives a different radio).
+- on a pseudo-terminal (Linux), run "python ft891sim.py [rate]" and put
+  the /dev/pts/N it prints in CPyS.cfg.
+"""
+import os
+import sys
+import math
+import time
+import select
+import numbers
+import threading
+import collections
+import urllib.parse
+
+from serial.serialutil import SerialBase, SerialException, PortNotOpenError
+
+import memory
+from cat import frame_key
+from const import (ENCODER, MENU_PARAMS, MENU_BY_CODE, COMBO, CAT_RATE, CAT_TOT, FUNCTIONS,
+                   FUNCTION_BY_KEY, MOMENTARY, PRESS, MEMORY_CHANNELS)
+
+# CAT RATE menu value -> baudrate
+RATES = {value: int(text.split()[0]) for text, value in CAT_RATE.items()}
+# CAT TOT menu value -> seconds
+TOTS = {value: int(text.split()[0]) / 1000 for text, value in CAT_TOT.items()}
+MODES = b"123456789ABCD"
+# Bits per byte on the wire, 8N1 with its start bit
+BITS = 10
+# Commands of the momentary functions, b"ZI"
+PRESSES = {function.encode(PRESS)[:-1] for function in FUNCTIONS if function.kind == MOMENTARY}
+# Functions the radio only takes in some modes, CW or FM
+ONLY_IN = {b"CO02": b"37", b"ZI": b"37", b"CT0": b"4B", b"OS0": b"4B"}
+# Level commands: key -> (prefix, low, high), three digits
+LEVELS = {b"AG": (b"AG0", 0, 255), b"RG": (b"RG0", 0, 255), b"SQ": (b"SQ0", 0, 100),
+          b"PC": (b"PC", 5, 100), b"MG": (b"MG", 0, 100), b"KS": (b"KS", 4, 60)}
+
+
+def default_menus():
+    """ EX menu table of a freshly reset radio """
+    return {param.code: param.encode(param.default)[6:-1] for param in MENU_PARAMS}
+
+
+class FT891:
+    """ Command interpreter and state of one simulated FT-891 """
+
+    def __init__(self, rate=9600):
+        self.menus = default_menus()
+        self.menus["0506"] = {baud: value for value, baud in RATES.items()}[rate]
+        self.vfo_a = 14074000
+        self.vfo_b = 7074000
+        self.mode = b"2"
+        self.auto_info = b"0"
+        self.levels = {b"AG": 128, b"RG": 255, b"SQ": 0, b"PC": 100, b"MG": 50, b"KS": 20}
+        self.tx = b"0"
+        self.functions = {key: function.table[function.states[0]]
+                          for key, function in FUNCTION_BY_KEY.items()}
+        # Ports to push the Auto Information frames to
+        self.listeners = []
+        # Channel -> MT record, a few channels are stored
+        self.memories = {}
+        for channel, freq, mode, tag in ((b"001", 14074000, b"2", b"FT8 20M"),
+                                         (b"002", 7074000, b"1", b"FT8 40M"),
+                                         (b"010", 50313000, b"C", b"")):
+            self.memories[channel] = (channel + b"%09d+000000" % freq + mode + b"00000" +
+                                      (b"1" if tag else b"0") + tag.ljust(memory.TAG_SIZE))
+        self.partial = b""
+        self.partial_at = 0.
+
+    @property
+    def baudrate(self):
+        return RATES[self.menus["0506"]]
+
+    @property
+    def tot(self):
+        return TOTS[self.menus["0507"]]
+
+    def receive(self, data, now):
+        """ Bytes whose first one arrived at `now`, returns the replies """
+        if self.partial and now - self.partial_at > self.tot:
+            # CAT TOT, an unfinished command is dropped
+            self.partial = b""
+        self.partial += data
+        self.partial_at = now
+
+        *frames, self.partial = self.partial.split(b";")
+        return b"".join(self.command(frame) for frame in frames)
+
+    def command(self, frame):
+        """ One CAT command without its ";" """
+        name, arg = frame[:2], frame[2:]
+        try:
+            if name == b"EX":
+                return self.ex(arg[:4].decode(ENCODER), arg[4:])
+            if name in (b"FA", b"FB"):
+                if not arg:
+                    freq = self.vfo_a if name == b"FA" else self.vfo_b
+                    return b"%s%09d;" % (name, freq)
+                if len(arg) != 9 or not 30000 <= int(arg) <= 56000000:
+                    return b"?;"
+                if name == b"FA":
+                    self.vfo_a = int(arg)
+                else:
+                    self.vfo_b = int(arg)
+                return b""
+            if name == b"MD":
+                if arg == b"0":
+                    return b"MD0" + self.mode + b";"
+                if len(arg) != 2 or arg[1:] not in MODES:
+                    return b"?;"
+                self.mode = arg[1:]
+                return b""
+            if name == b"IF" and not arg:
+                return b"IF001%09d+000000%s00000;" % (self.vfo_a, self.mode)
+            if name == b"ID" and not arg:
+                return b"ID0650;"
+            if name == b"RM" and arg in (b"1", b"3", b"4", b"5", b"6", b"7"):
+                return b"RM%s%03d;" % (arg, self.meter(int(arg)))
+            if name == b"SM" and arg == b"0":
+                return b"SM0%03d;" % self.meter(1)
+            if name == b"TX":
+                if not arg:
+                    return b"TX" + self.tx + b";"
+                if arg not in (b"0", b"1"):
+                    return b"?;"
+                self.tx = arg
+                return b""
+            if name in LEVELS:
+                return self.level(name, frame)
+            if name in (b"MR", b"MW", b"MT"):
+                return self.memory(name, arg)
+            if name == b"AI":
+                if not arg:
+                    return b"AI" + self.auto_info + b";"
+                if arg not in (b"0", b"1"):
+                    return b"?;"
+                self.auto_info = arg
+                return b""
+            function = FUNCTION_BY_KEY.get(frame_key(frame))
+            if function is not None:
+                return self.function(function, frame[len(function.key):])
+            if frame in PRESSES and self.mode in ONLY_IN.get(frame_key(frame), MODES):
+                return b""
+        except ValueError:
+            pass
+        return b"?;"
+
+    def memory(self, name, arg):
+        """ Memory channel read (MR, MT) or write (MW, MT), an empty channel reads "?;" """
+        channel = arg[:3]
+        if channel.decode(ENCODER) not in MEMORY_CHANNELS:
+            return b"?;"
+        if len(arg) == 3 and name != b"MW":
+            if channel not in self.memories:
+                return b"?;"
+            record = self.memories[channel]
+            return name + (record if name == b"MT" else record[:memory.MW_SIZE]) + b";"
+
+        size = memory.MW_SIZE if name == b"MW" else memory.RECORD
+        if len(arg) != size:
+            return b"?;"
+        # Without a tag, MW keeps the one stored
+        record = arg + self.memories.get(channel, memory.BLANK)[size:]
+        if any(memory.field_value(column, record) is None for column in memory.COLUMNS):
+            return b"?;"
+        if not memory.FREQ_MIN <= memory.field_value(memory.FREQUENCY, record) <= memory.FREQ_MAX:
+            return b"?;"
+        self.memories[channel] = record
+        return b""
+
+    def level(self, name, frame):
+        """ AF, RF, SQL, power, mic gain or key speed read or set """
+        prefix, low, high = LEVELS[name]
+        value = frame[len(prefix):]
+        if not frame.startswith(prefix):
+            return b"?;"
+        if not value:
+            return prefix + b"%03d;" % self.levels[name]
+        if len(value) != 3 or not low <= int(value) <= high:
+            return b"?;"
+        self.levels[name] = int(value)
+        return b""
+
+    def function(self, function, value):
+        """ Front panel function read or set """
+        if not value:
+            return function.key + self.functions[function.key] + b";"
+        if value not in function.table.values() or self.mode not in ONLY_IN.get(function.key, MODES):
+            return b"?;"
+        self.functions[function.key] = value
+        return b""
+
+    @staticmethod
+    def meter(number):
+        """ Nothing is received or transmitted here, the meters wander so the panel moves """
+        return round(127.5 + 127.5 * math.sin(time.perf_counter() * (0.5 + number / 4)))
+
+    def front_panel(self, frame):
+        """ Change made on the radio, b"FA014075000;", pushed when AI is on """
+        if self.command(frame[:-1]) == b"" and self.auto_info == b"1":
+            for push in self.listeners:
+                push(frame)
+
+    def ex(self, code, value):
+        """ EX menu read or set """
+        if code == "1701" and value in (b"0", b"1", b"2"):
+            # RESET, 0 all, 1 memory channels, 2 menu
+            if value != b"1":
+                self.menus = default_menus()
+            return b""
+        param = MENU_BY_CODE.get(code)
+        if param is None:
+            return b"?;"
+        if not value:
+            return b"EX" + bytes(code, ENCODER) + self.menus[code] + b";"
+        if param.kind == COMBO:
+            if value not in param.texts:
+                return b"?;"
+        else:
+            low = int(param.encode(param.minimum)[6:-1])
+            high = int(param.encode(param.maximum)[6:-1])
+            if len(value) != len(self.menus[code]) or not low <= int(value) <= high:
+                return b"?;"
+        self.menus[code] = value
+        return b""
+
+
+# One radio per URL name, shared by all the ports opened on it
+RIGS = {}
+
+
+class Serial(SerialBase):
+    """ pyserial port connected to a simulated FT-891, URL ft891://name """
+
+    def __init__(self, *args, **kwargs):
+        self.rig = None
+        self.pacing = True
+        self.latency = 0.
+        self.incoming = collections.deque()
+        # A read waiting in another thread is woken up by the replies
+        self.arrived = threading.Condition()
+        self.tx_free = 0.
+        self.rx_free = 0.
+        super().__init__(*args, **kwargs)
+
+    def open(self):
+        if self.is_open:
+            raise SerialException("Port is already open.")
+        if self._port is None:
+            raise SerialException("Port must be configured before it can be used.")
+        self.from_url(self.port)
+        self._reconfigure_port()
+        self.is_open = True
+        self.reset_input_buffer()
+        self.rig.listeners.append(self.push)
+
+    def from_url(self, url):
+        """ Radio name and options of ft891://name?rate=9600&pacing=on&latency=0 """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "ft891":
+            raise SerialException(f"expected ft891://[name][?options], got {url!r}")
+        options = dict(urllib.parse.parse_qsl(parts.query))
+        try:
+            rate = int(options.get("rate", 9600))
+            if parts.netloc not in RIGS:
+                RIGS[parts.netloc] = FT891(rate)
+            self.pacing = options.get("pacing", "on") != "off"
+            self.latency = float(options.get("latency", 0))
+        except (ValueError, KeyError) as e:
+            raise SerialException(f"bad ft891:// option: {e}")
+        self.rig = RIGS[parts.netloc]
+
+    def _reconfigure_port(self):
+        if not isinstance(self._baudrate, numbers.Integral) or self._baudrate <= 0:
+            raise ValueError(f"invalid baudrate: {self._baudrate!r}")
+
+    def byte_time(self):
+        return BITS / self._baudrate if self.pacing else 0.
+
+    def close(self):
+        if self.rig is not None and self.push in self.rig.listeners:
+            self.rig.listeners.remove(self.push)
+        self.is_open = False
+        super().close()
+
+    def push(self, frame):
+        """ Auto Information frame from the radio """
+        if self._baudrate == self.rig.baudrate:
+            self.send_reply(frame, time.perf_counter() + self.latency)
+
+    @property
+    def in_waiting(self):
+        if not self.is_open:
+            raise PortNotOpenError()
+        now = time.perf_counter()
+        return sum(1 for ready, _ in self.incoming if ready <= now)
+
+    def write(self, data):
+        """ Hand the bytes to the radio, they arrive at the line speed """
+        if not self.is_open:
+            raise PortNotOpenError()
+        data = bytes(data)
+        if not data:
+            return 0
+        byte_time = self.byte_time()
+        now = time.perf_counter()
+        start = max(now, self.tx_free)
+        self.tx_free = start + len(data) * byte_time
+
+        if self._baudrate != self.rig.baudrate:
+            # Wrong CAT RATE, the radio only sees garbage
+            self.rig.partial = b""
+            return len(data)
+
+        # Commands are interpreted when their ";" arrives
+        offset = 0
+        for frame in data.split(b";")[:-1]:
+            reply = self.rig.receive(frame + b";", start + offset * byte_time)
+            offset += len(frame) + 1
+            self.send_reply(reply, start + offset * byte_time + self.latency)
+        if offset < len(data):
+            self.rig.receive(data[offset:], start + offset * byte_time)
+        return len(data)
+
+    def send_reply(self, reply, ready):
+        """ Queue the reply bytes at the time they reach the computer """
+        byte_time = self.byte_time()
+        ready = max(ready, self.rx_free)
+        with self.arrived:
+            for byte in reply:
+                ready += byte_time
+                self.incoming.append((ready, bytes((byte,))))
+            self.rx_free = ready
+            self.arrived.notify_all()
+
+    def read(self, size=1):
+        if not self.is_open:
+            raise PortNotOpenError()
+        deadline = None if self._timeout is None else time.perf_counter() + self._timeout
+        data = bytearray()
+        while len(data) < size:
+            now = time.perf_counter()
+            while self.incoming and self.incoming[0][0] <= now and len(data) < size:
+                data += self.incoming.popleft()[1]
+            if len(data) >= size:
+                break
+            if deadline is not None and now >= deadline:
+                break
+            with self.arrived:
+                wake = self.incoming[0][0] if self.incoming else float("inf")
+                if deadline is not None:
+                    wake = min(wake, deadline)
+                if wake == float("inf"):
+                    # Nothing will ever come and no timeout, like a dead line
+                    raise SerialException("ft891:// read without timeout on an idle radio")
+                if self.incoming:
+                    time.sleep(max(0., wake - now))
+                else:
+                    self.arrived.wait(max(0., wake - now))
+        return bytes(data)
+
+    def flush(self):
+        """ Wait until the last byte written is on the wire """
+        wait = self.tx_free - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+
+    def reset_input_buffer(self):
+        self.incoming.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    def _update_rts_state(self):
+        pass
+
+    def _update_dtr_state(self):
+        pass
+
+    def _update_break_state(self):
+        pass
+
+    @property
+    def cts(self):
+        return True
+
+    @property
+    def dsr(self):
+        return True
+
+    @property
+    def ri(self):
+        return False
+
+    @property
+    def cd(self):
+        return True
+
+
+def serve_pty(rate=9600):
+    """ Simulated radio on a pseudo-terminal, until Ctrl-C """
+    import tty
+
+    rig = FT891(rate)
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    print(os.ttyname(slave), flush=True)
+    while True:
+        select.select([master], [], [])
+        data = os.read(master, 1024)
+        # Line speed of the radio, host and radio must agree on the rate
+        time.sleep(len(data) * BITS / rig.baudrate)
+        reply = rig.receive(data, time.perf_counter())
+        if reply:
+            time.sleep(len(reply) * BITS / rig.baudrate)
+            os.write(master, reply)
+
+
+if __name__ == "__main__":
+    try:
+        serve_pty(int(sys.argv[1]) if len(sys.argv) > 1 else 9600)
+    except KeyboardInterrupt:
+        pass
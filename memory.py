@@ -0,0 +1,334 @@
+##########################################################################
+#            Memory channels of the Yaesu FT-891 (no Qt here)            #
+##########################################################################
+"""
+The channels are kept as the records of the MT replies, one fixed size
+slot per channel in a bytearray, a second one holds what the radio has.
+The fields, spaced out:
+
+    MT 001 014074000 +0000 0 0 2 0 0 00 0 1 FT8 20M     ;
+
+channel, frequency, clarifier offset, RX and TX clarifier, mode, VFO or
+memory (kept as read), CTCSS, 00, shift, tag on/off, tag of 12 characters.
+
+A table is read with one pipelined pass of MEMORY_QUERIES and only the
+changed channels are written back, with MW when the tag did not change
+and MT otherwise.
+
+Channel plans are CSV files, in the columns of the grid or in the CHIRP
+layout. They are read and checked one row at a time, a file bigger than
+the radio never sits in memory.
+"""
+import csv
+
+from const import ENCODER, MEMORY_CHANNELS, MODES, CTCSS_STATE, RPT_SHIFT_DIR, TAG_STATE, OFF_ON
+
+# MT record without "MT" and ";", the MW record is its first MW_SIZE bytes
+RECORD = 38
+MW_SIZE = 25
+# Record of a channel stored for the first time
+BLANK = b"000" + b"014000000" + b"+0000" + b"00" + b"2" + b"0" + b"0" + b"00" + b"0" + b"0" + b" " * 12
+FREQ_MIN, FREQ_MAX = 30000, 56000000
+CLAR_MIN, CLAR_MAX = -9999, 9999
+TAG_SIZE = 12
+
+FREQUENCY = "Frequency"
+CLARIFIER = "Clarifier"
+NAME = "Tag"
+# Column -> first and last byte in the record, table of the texts (None for a number or the tag)
+FIELDS = {
+    FREQUENCY: (3, 12, None),
+    "Mode": (19, 20, MODES),
+    CLARIFIER: (12, 17, None),
+    "RX CLAR": (17, 18, OFF_ON),
+    "TX CLAR": (18, 19, OFF_ON),
+    "CTCSS": (21, 22, CTCSS_STATE),
+    "Shift": (24, 25, RPT_SHIFT_DIR),
+    "Tag state": (25, 26, TAG_STATE),
+    NAME: (26, 38, None),
+}
+COLUMNS = tuple(FIELDS)
+# Record bytes -> text, for the columns with a table
+TEXTS = {column: {value: text for text, value in table.items()}
+         for column, (_, _, table) in FIELDS.items() if table is not None}
+
+
+def field_bytes(column, value):
+    """ Bytes of a value in the record, ValueError when the radio would not take it """
+    _, _, table = FIELDS[column]
+    if table is not None:
+        if value not in table:
+            raise ValueError(f"{column}: {value!r} is not one of {', '.join(table)}")
+        return table[value]
+    if column == NAME:
+        text = str(value)
+        if len(text) > TAG_SIZE or not text.isascii() or not text.isprintable():
+            raise ValueError(f"{column}: {value!r} is not up to {TAG_SIZE} ASCII characters")
+        return bytes(text.ljust(TAG_SIZE), ENCODER)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{column}: {value!r} is not a number")
+    if column == FREQUENCY:
+        if not FREQ_MIN <= value <= FREQ_MAX:
+            raise ValueError(f"{column}: {value} is not in {FREQ_MIN}..{FREQ_MAX} Hz")
+        return b"%09d" % value
+    if not CLAR_MIN <= value <= CLAR_MAX:
+        raise ValueError(f"{column}: {value} is not in {CLAR_MIN}..{CLAR_MAX} Hz")
+    return b"%+05d" % value
+
+
+def field_value(column, record):
+    """ Value of a column in a record, None when the radio sent something unknown """
+    start, end, table = FIELDS[column]
+    data = bytes(record[start:end])
+    if table is not None:
+        return TEXTS[column].get(data)
+    if column == NAME:
+        return data.decode(ENCODER, "replace").rstrip()
+    try:
+        return int(data)
+    except ValueError:
+        return None
+
+
+class MemoryTable:
+    """ Memory channels as MT records in one bytearray, with the copy of the radio """
+
+    def __init__(self, channels=MEMORY_CHANNELS):
+        self.channels = channels
+        self.row_of = {channel: row for row, channel in enumerate(channels)}
+        self.data = bytearray(RECORD * len(channels))
+        self.radio = bytearray(RECORD * len(channels))
+        # 1 for the channels that hold something, here and in the radio
+        self.used = bytearray(len(channels))
+        self.radio_used = bytearray(len(channels))
+
+    def __len__(self):
+        return len(self.channels)
+
+    def record(self, row):
+        return memoryview(self.data)[row * RECORD:(row + 1) * RECORD]
+
+    @staticmethod
+    def blank(column):
+        """ Value of a column in a channel stored for the first time """
+        return field_value(column, BLANK)
+
+    def get(self, row, column):
+        """ Value of a channel column, None for an empty channel """
+        if not self.used[row]:
+            return None
+        return field_value(column, self.record(row))
+
+    def set(self, row, column, value):
+        """ Change a column, an empty channel gets a blank record first """
+        start, end, _ = FIELDS[column]
+        value = field_bytes(column, value)
+        if not self.used[row]:
+            self.data[row * RECORD:(row + 1) * RECORD] = bytes(self.channels[row], ENCODER) + BLANK[3:]
+            self.used[row] = 1
+        self.data[row * RECORD + start:row * RECORD + end] = value
+
+    def changed(self, row):
+        """ True when the channel differs from the radio """
+        begin, end = row * RECORD, (row + 1) * RECORD
+        return self.used[row] and (not self.radio_used[row] or
+                                   self.data[begin:end] != self.radio[begin:end])
+
+    def changed_rows(self):
+        return [row for row in range(len(self.channels)) if self.changed(row)]
+
+    def load(self, replies, keep=False):
+        """ MT replies of a pipelined read, {b"MT001;": b"MT001...;"}, returns the rows read
+
+        With `keep`, only the copy of the radio is updated and the table
+        keeps its values: a channel the radio did not take stays changed.
+        """
+        rows = []
+        for query, resp in replies.items():
+            row = self.row_of.get(query[2:5].decode(ENCODER))
+            if row is None:
+                continue
+            begin, end = row * RECORD, (row + 1) * RECORD
+            if len(resp) == RECORD + 3 and resp[:5] == query[:5]:
+                self.radio[begin:end] = resp[2:-1]
+                self.radio_used[row] = 1
+            else:
+                # "?;", the channel is empty
+                self.radio[begin:end] = bytes(RECORD)
+                self.radio_used[row] = 0
+            if not keep:
+                self.data[begin:end] = self.radio[begin:end]
+                self.used[row] = self.radio_used[row]
+            rows.append(row)
+        return rows
+
+    def frames(self, rows=None):
+        """ Set commands of the changed channels, MW unless the tag changed """
+        frames = []
+        for row in self.changed_rows() if rows is None else rows:
+            begin = row * RECORD
+            record = bytes(self.data[begin:begin + RECORD])
+            if self.radio_used[row] and self.radio[begin + MW_SIZE:begin + RECORD] == record[MW_SIZE:]:
+                frames.append(b"MW" + record[:MW_SIZE] + b";")
+            else:
+                frames.append(b"MT" + record + b";")
+        return frames
+
+    def queries(self, rows):
+        return [b"MT" + bytes(self.channels[row], ENCODER) + b";" for row in rows]
+
+
+#########################################################################
+#                        CSV import / export
+#########################################################################
+NATIVE = "native"
+CHIRP = "chirp"
+NATIVE_HEADER = ("Channel",) + COLUMNS
+CHIRP_HEADER = ("Location", "Name", "Frequency", "Duplex", "Offset", "Tone", "rToneFreq", "cToneFreq",
+                "DtcsCode", "DtcsPolarity", "RxDtcsCode", "CrossMode", "Mode", "TStep", "Skip", "Power",
+                "Comment", "URCALL", "RPT1CALL", "RPT2CALL", "DVCODE")
+# FT-891 text -> CHIRP text, CHIRP has no DATA-LSB, it is exported as DIG
+CHIRP_MODES = {"LSB": "LSB", "USB": "USB", "CW": "CW", "FM": "FM", "AM": "AM", "RTTY-LSB": "RTTY",
+               "CW-R": "CWR", "DATA-LSB": "DIG", "FM-N": "NFM", "DATA-USB": "DIG", "AM-N": "NAM"}
+CHIRP_TONES = {"CTCSS OFF": "", "CTCSS ENC/DEC": "TSQL", "CTCSS ENC": "Tone"}
+CHIRP_DUPLEX = {"Simplex": "", "Plus Shift": "+", "Minus Shift": "-"}
+# CHIRP text -> FT-891 text
+FROM_CHIRP = {"Mode": {**{chirp: mode for mode, chirp in CHIRP_MODES.items()}, "DIG": "DATA-USB"},
+              "CTCSS": {chirp: tone for tone, chirp in CHIRP_TONES.items()},
+              "Shift": {chirp: shift for shift, chirp in CHIRP_DUPLEX.items()}}
+
+
+class RowError(ValueError):
+    """ Row of a channel file the radio cannot take """
+
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+def chirp_row(channel, values):
+    """ CHIRP row of a channel, the Location is its row in MEMORY_CHANNELS plus 1 """
+    row = dict.fromkeys(CHIRP_HEADER, "")
+    row.update({"Location": MEMORY_CHANNELS.index(channel) + 1,
+                "Name": values[NAME] if values["Tag state"] == "TAG ON" else "",
+                "Frequency": f"{values[FREQUENCY] / 1e6:.6f}",
+                "Duplex": CHIRP_DUPLEX[values["Shift"]],
+                "Offset": "0.000000",
+                "Tone": CHIRP_TONES[values["CTCSS"]],
+                "rToneFreq": "88.5", "cToneFreq": "88.5",
+                "DtcsCode": "023", "DtcsPolarity": "NN", "RxDtcsCode": "023",
+                "CrossMode": "Tone->Tone",
+                "Mode": CHIRP_MODES[values["Mode"]],
+                "TStep": "5.00", "Skip": ""})
+    return row
+
+
+def write_channels(file, table, layout=NATIVE):
+    """ Used channels of the table as CSV rows, returns the number of channels """
+    count = 0
+    if layout == CHIRP:
+        writer = csv.DictWriter(file, CHIRP_HEADER)
+        writer.writeheader()
+    else:
+        writer = csv.writer(file)
+        writer.writerow(NATIVE_HEADER)
+    for row, channel in enumerate(table.channels):
+        if not table.used[row]:
+            continue
+        values = {column: table.get(row, column) for column in COLUMNS}
+        if None in values.values():
+            # Something this version does not know, it is not exported half
+            continue
+        if layout == CHIRP:
+            writer.writerow(chirp_row(channel, values))
+        else:
+            writer.writerow([channel] + [values[column] for column in COLUMNS])
+        count += 1
+    return count
+
+
+def parse_native(row):
+    """ {column: value} of a row in the columns of the grid, empty cells are left out """
+    channel = row.get("Channel") or ""
+    values = {}
+    for column in COLUMNS:
+        text = (row.get(column) or "").strip()
+        if text == "" and column != NAME:
+            continue
+        if column in (FREQUENCY, CLARIFIER):
+            try:
+                text = int(text)
+            except ValueError:
+                raise ValueError(f"{column}: {text!r} is not a number")
+        values[column] = text
+    return channel.strip(), values
+
+
+def parse_chirp(row):
+    """ {column: value} of a CHIRP row """
+    try:
+        location = int(row.get("Location") or "")
+    except ValueError:
+        raise ValueError(f"Location: {row.get('Location')!r} is not a number")
+    if not 1 <= location <= len(MEMORY_CHANNELS):
+        raise ValueError(f"Location: no memory channel {location} on the FT-891")
+    try:
+        values = {FREQUENCY: round(float(row.get("Frequency") or "") * 1e6)}
+    except ValueError:
+        raise ValueError(f"Frequency: {row.get('Frequency')!r} is not a frequency in MHz")
+    for column, cell in (("Mode", "Mode"), ("CTCSS", "Tone"), ("Shift", "Duplex")):
+        text = (row.get(cell) or "").strip()
+        if text not in FROM_CHIRP[column]:
+            raise ValueError(f"{cell}: {text!r} is not one of {', '.join(FROM_CHIRP[column])}")
+        values[column] = FROM_CHIRP[column][text]
+    name = (row.get("Name") or "").strip()
+    values[NAME] = name
+    values["Tag state"] = "TAG ON" if name else "TAG OFF"
+    return MEMORY_CHANNELS[location - 1], values
+
+
+def read_channels(file, errors=None):
+    """ Channels of a CSV file, native or CHIRP layout, one row at a time
+
+    Yields (line, channel, {column: value}) for the rows the radio can
+    take. A bad row raises a RowError with its line number, or, when
+    `errors` is a list, is appended to it and the next rows are read.
+    """
+    reader = csv.DictReader(file)
+    fields = reader.fieldnames or []
+    if "Location" in fields:
+        parse = parse_chirp
+    elif "Channel" in fields:
+        parse = parse_native
+    else:
+        raise RowError(1, "no Channel or Location column, not a channel file")
+
+    seen = {}
+    for row in reader:
+        try:
+            channel, values = parse(row)
+            if channel not in MEMORY_CHANNELS:
+                raise ValueError(f"Channel: no memory channel {channel!r} on the FT-891")
+            if channel in seen:
+                raise ValueError(f"channel {channel} is already on line {seen[channel]}")
+            for column, value in values.items():
+                field_bytes(column, value)
+        except ValueError as e:
+            error = RowError(reader.line_num, str(e))
+            if errors is None:
+                raise error
+            errors.append(error)
+            continue
+        seen[channel] = reader.line_num
+        yield reader.line_num, channel, values
+
+
+def import_channels(table, channels):
+    """ Put the channels of read_channels() in the table, returns the rows now changed """
+    rows = set()
+    for _, channel, values in channels:
+        row = table.row_of[channel]
+        for column, value in values.items():
+            table.set(row, column, value)
+        rows.add(row)
+    return [row for row in sorted(rows) if table.changed(row)]
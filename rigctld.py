@@ -0,0 +1,364 @@
+##########################################################################
+#       hamlib rigctld server sharing the CAT link (no Qt here)          #
+##########################################################################
+"""
+Loggers and digital mode programs use the radio through CPyS-891 while it
+holds the serial port: choose "Hamlib NET rigctl" (model 2) in them, with
+localhost:4532.
+
+Commands: f F m M l L t T v V s S q, and \\dump_state, \\chk_vfo,
+\\get_powerstat, short or long (\\get_freq). Levels: AF RF SQL RFPOWER
+MICGAIN KEYSPD STRENGTH.
+
+Every client goes through one StateCache: a reply is reused by all of them
+for RIGCTL_CACHE seconds and a query is on the wire once at a time, so
+several programs polling at 10 Hz cost the CAT link what one of them does.
+The link is a function (frame, query) -> (accepted, reply) run where the
+port is owned: the CAT thread of the window (posted) or a lock (serial_link).
+
+Without the window:  python3 rigctld.py [--port PORT] [--listen 4532]
+"""
+import sys
+import time
+import bisect
+import platform
+import argparse
+import threading
+import socketserver
+import configparser
+
+from cat import set_function, frame_key, MODE_NAMES
+from const import MODES, BAUDRATE, RIGCTL_PORT, RIGCTL_CACHE, RIGCTL_TIMEOUT
+
+# hamlib error codes, "RPRT -n"
+RIG_OK = 0
+RIG_EINVAL = 1
+RIG_ENIMPL = 4
+RIG_ETIMEOUT = 5
+RIG_EIO = 6
+RIG_ERJCTED = 9
+
+# FT-891 mode name -> hamlib mode name
+HAMLIB_MODES = {"LSB": "LSB", "USB": "USB", "CW": "CW", "FM": "FM", "AM": "AM",
+                "RTTY-LSB": "RTTY", "CW-R": "CWR", "DATA-LSB": "PKTLSB",
+                "FM-N": "FMN", "DATA-USB": "PKTUSB", "AM-N": "AMN"}
+FROM_HAMLIB = {hamlib: MODES[name] for name, hamlib in HAMLIB_MODES.items()}
+# hamlib mode bits, rig.h
+MODE_BITS = {"AM": 1 << 0, "CW": 1 << 1, "USB": 1 << 2, "LSB": 1 << 3, "RTTY": 1 << 4,
+             "FM": 1 << 5, "CWR": 1 << 7, "PKTLSB": 1 << 10, "PKTUSB": 1 << 11,
+             "FMN": 1 << 21, "AMN": 1 << 29}
+ALL_MODES = sum(MODE_BITS.values())
+
+# hamlib level -> (query, set prefix or None, scale), the radio counts 0..scale,
+# hamlib 0.0..1.0, a scale of 1 is an integer level
+LEVELS = {"AF": (b"AG0;", b"AG0", 255), "RF": (b"RG0;", b"RG0", 255),
+          "SQL": (b"SQ0;", b"SQ0", 100), "RFPOWER": (b"PC;", b"PC", 100),
+          "MICGAIN": (b"MG;", b"MG", 100), "KEYSPD": (b"KS;", b"KS", 1),
+          "STRENGTH": (b"SM0;", None, 1)}
+LEVEL_BITS = {"AF": 1 << 3, "RF": 1 << 4, "SQL": 1 << 5, "RFPOWER": 1 << 12,
+              "MICGAIN": 1 << 13, "KEYSPD": 1 << 14, "STRENGTH": 1 << 30}
+# S-meter reading -> dB over S9, the FT-891 calibration of hamlib
+STRENGTH_CAL = ((0, -54), (12, -48), (27, -42), (40, -36), (55, -30), (65, -24),
+                (80, -18), (95, -12), (112, -6), (130, 0), (150, 10), (172, 20),
+                (190, 30), (220, 40), (240, 50), (255, 60))
+
+
+class RigError(Exception):
+    """ Command that gets "RPRT -code" """
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+def strength(raw):
+    """ S-meter reading -> dB over S9 """
+    index = bisect.bisect_left([point[0] for point in STRENGTH_CAL], raw)
+    if index == 0:
+        return STRENGTH_CAL[0][1]
+    if index == len(STRENGTH_CAL):
+        return STRENGTH_CAL[-1][1]
+    (raw0, db0), (raw1, db1) = STRENGTH_CAL[index - 1], STRENGTH_CAL[index]
+    return round(db0 + (db1 - db0) * (raw - raw0) / (raw1 - raw0))
+
+
+def dump_state():
+    """ Capabilities of the rig, hamlib protocol 0 """
+    ranges = f"30000.000000 56000000.000000 0x{ALL_MODES:x} -1 -1 0x3 0x1\n0 0 0 0 0 0 0\n"
+    tx_modes = ALL_MODES & ~(MODE_BITS["AM"] | MODE_BITS["AMN"])
+    tx_ranges = (f"1800000.000000 56000000.000000 0x{tx_modes:x} 5000 100000 0x3 0x1\n"
+                 f"1800000.000000 56000000.000000 0x{MODE_BITS['AM'] | MODE_BITS['AMN']:x} "
+                 f"5000 40000 0x3 0x1\n"
+                 "0 0 0 0 0 0 0\n")
+    get_levels = sum(LEVEL_BITS.values())
+    set_levels = sum(LEVEL_BITS[name] for name, level in LEVELS.items() if level[1] is not None)
+    return ("0\n2\n1\n" + ranges + tx_ranges +
+            f"0x{ALL_MODES:x} 10\n0 0\n"
+            f"0x{ALL_MODES:x} 0\n0 0\n"
+            "9999\n9999\n0\n0\n10\n12\n"
+            f"0x0\n0x0\n0x{get_levels:x}\n0x{set_levels:x}\n0x0\n0x0\n")
+
+
+class Request:
+    """ CAT request handed over to the thread that owns the port """
+
+    def __init__(self, frame, query):
+        self.frame = frame
+        self.query = query
+        self.result = (False, b"")
+        self.done = threading.Event()
+
+    def answer(self, accepted, reply):
+        self.result = (accepted, reply)
+        self.done.set()
+
+
+def posted(post, timeout=RIGCTL_TIMEOUT):
+    """ Link of a port owned by another thread, post(Request) hands it over """
+    def request(frame, query):
+        req = Request(frame, query)
+        post(req)
+        if not req.done.wait(timeout):
+            raise RigError(RIG_ETIMEOUT)
+        return req.result
+    return request
+
+
+def serial_link(rig, lock=None):
+    """ Link of a pyserial port shared by the client threads """
+    lock = lock or threading.Lock()
+
+    def request(frame, query):
+        with lock:
+            return set_function(rig, frame, query)
+    return request
+
+
+class StateCache:
+    """ Last replies of the radio, one request on the wire per key at a time """
+
+    def __init__(self, link, ttl=RIGCTL_CACHE):
+        self.link = link
+        self.ttl = ttl
+        # key -> (reply, time.monotonic() it came)
+        self.replies = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+
+    def key_lock(self, key):
+        with self.lock:
+            return self.locks.setdefault(key, threading.Lock())
+
+    def update(self, frames):
+        """ Replies or pushes (Auto Information) that came another way """
+        now = time.monotonic()
+        for frame in frames:
+            self.replies[frame_key(frame)] = (frame, now)
+
+    def read(self, query):
+        """ Reply of a query, from the cache when it is recent enough """
+        key = frame_key(query)
+        # A client waiting here gets the reply of the one on the wire
+        with self.key_lock(key):
+            reply, at = self.replies.get(key, (b"", 0.))
+            if time.monotonic() - at < self.ttl:
+                return reply
+            accepted, reply = self.link(b"", query)
+            if not reply:
+                raise RigError(RIG_EIO)
+            self.update((reply,))
+            return reply
+
+    def write(self, frame, query):
+        """ Set command, the reply of the query that follows it is kept """
+        with self.key_lock(frame_key(query)):
+            accepted, reply = self.link(frame, query)
+            if not reply:
+                raise RigError(RIG_EIO)
+            self.update((reply,))
+            if not accepted:
+                raise RigError(RIG_ERJCTED)
+
+
+class RigctlHandler(socketserver.StreamRequestHandler):
+    """ One rigctld client, a command per line """
+
+    def handle(self):
+        cache = self.server.cache
+        for line in self.rfile:
+            args = line.decode("ascii", "replace").split()
+            if not args:
+                continue
+            command, args = args[0], args[1:]
+            if len(command) > 1 and command[0] != "\\" and command[0] in COMMANDS:
+                # "F14074000", arguments stuck to a one letter command
+                command, args = command[0], [command[1:]] + args
+            if command in ("q", "Q", "\\quit"):
+                return
+            method = COMMANDS.get(command)
+            try:
+                if method is None:
+                    raise RigError(RIG_ENIMPL)
+                answer = method(cache, *args)
+            except RigError as e:
+                answer = f"RPRT -{e.code}\n"
+            except (TypeError, ValueError, KeyError):
+                # Missing, extra or bad arguments
+                answer = f"RPRT -{RIG_EINVAL}\n"
+            self.wfile.write(answer.encode("ascii"))
+
+
+# ###### Commands, (cache, *arguments) -> answer
+
+def get_freq(cache):
+    return f"{int(cache.read(b'FA;')[2:-1])}\n"
+
+
+def set_freq(cache, freq):
+    cache.write(b"FA%09d;" % round(float(freq)), b"FA;")
+    return f"RPRT {RIG_OK}\n"
+
+
+def get_mode(cache):
+    mode = MODE_NAMES.get(cache.read(b"MD0;")[3:4])
+    if mode is None:
+        raise RigError(RIG_EIO)
+    # Passband 0, the normal one of the mode
+    return f"{HAMLIB_MODES[mode]}\n0\n"
+
+
+def set_mode(cache, mode, passband=None):
+    # The FT-891 keeps the width it had for the mode, passband is not used
+    cache.write(b"MD0" + FROM_HAMLIB[mode.upper()] + b";", b"MD0;")
+    return f"RPRT {RIG_OK}\n"
+
+
+def get_level(cache, name):
+    query, _, scale = LEVELS[name.upper()]
+    raw = int(cache.read(query)[len(query) - 1:-1])
+    if name.upper() == "STRENGTH":
+        return f"{strength(raw)}\n"
+    if scale == 1:
+        return f"{raw}\n"
+    return f"{raw / scale:f}\n"
+
+
+def set_level(cache, name, value):
+    query, prefix, scale = LEVELS[name.upper()]
+    if prefix is None:
+        raise RigError(RIG_EINVAL)
+    raw = round(float(value) * scale)
+    if not 0 <= raw <= 999:
+        raise RigError(RIG_EINVAL)
+    cache.write(prefix + b"%03d;" % raw, query)
+    return f"RPRT {RIG_OK}\n"
+
+
+def get_ptt(cache):
+    return "0\n" if cache.read(b"TX;")[2:3] == b"0" else "1\n"
+
+
+def set_ptt(cache, ptt):
+    cache.write(b"TX1;" if int(ptt) else b"TX0;", b"TX;")
+    return f"RPRT {RIG_OK}\n"
+
+
+def get_vfo(cache):
+    # FA is the VFO the other commands use
+    return "VFOA\n"
+
+
+def set_vfo(cache, vfo):
+    if vfo not in ("VFOA", "Main", "currVFO"):
+        raise RigError(RIG_EINVAL)
+    return f"RPRT {RIG_OK}\n"
+
+
+def get_split_vfo(cache):
+    return f"{int(cache.read(b'ST;')[2:3])}\nVFOB\n"
+
+
+def set_split_vfo(cache, split, tx_vfo="VFOB"):
+    cache.write(b"ST1;" if int(split) else b"ST0;", b"ST;")
+    return f"RPRT {RIG_OK}\n"
+
+
+def chk_vfo(cache):
+    return "0\n"
+
+
+def get_powerstat(cache):
+    return "1\n"
+
+
+def get_dump_state(cache):
+    return dump_state()
+
+
+COMMANDS = {}
+for short, long, method in (("f", "get_freq", get_freq), ("F", "set_freq", set_freq),
+                            ("m", "get_mode", get_mode), ("M", "set_mode", set_mode),
+                            ("l", "get_level", get_level), ("L", "set_level", set_level),
+                            ("t", "get_ptt", get_ptt), ("T", "set_ptt", set_ptt),
+                            ("v", "get_vfo", get_vfo), ("V", "set_vfo", set_vfo),
+                            ("s", "get_split_vfo", get_split_vfo), ("S", "set_split_vfo", set_split_vfo),
+                            (None, "chk_vfo", chk_vfo), (None, "get_powerstat", get_powerstat),
+                            (None, "dump_state", get_dump_state)):
+    if short is not None:
+        COMMANDS[short] = method
+    COMMANDS["\\" + long] = method
+
+
+class RigctlServer(socketserver.ThreadingTCPServer):
+    """ rigctld on a TCP port, a thread per client """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, link, ttl=RIGCTL_CACHE):
+        super().__init__(address, RigctlHandler)
+        self.cache = StateCache(link, ttl)
+
+    def start(self):
+        """ Serve in a thread of its own """
+        threading.Thread(target=self.serve_forever, name="rigctld", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv=None):
+    from cli import open_rig
+
+    config = configparser.ConfigParser()
+    config.read("./CPyS.cfg")
+    default = config["DEFAULT"]
+    port = default.get("windows_port" if platform.system() == "Windows" else "linux_port", "")
+
+    parser = argparse.ArgumentParser(prog="rigctld.py", description="rigctld for the FT-891")
+    parser.add_argument("--port", default=port, help="serial port or ft891:// simulator URL")
+    parser.add_argument("--baudrate", default=default.get("baudrate", "9600"), choices=BAUDRATE)
+    parser.add_argument("--listen", type=int, default=default.getint("rigctld_port", RIGCTL_PORT),
+                        help="TCP port on localhost")
+    args = parser.parse_args(argv)
+
+    rig = open_rig(args.port, [args.baudrate], False)
+    if rig is None:
+        print("FT-891 not found", file=sys.stderr)
+        return 1
+    server = RigctlServer(("127.0.0.1", args.listen), serial_link(rig))
+    print(f"rigctld on 127.0.0.1:{args.listen}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        rig.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
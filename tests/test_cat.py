@@ -0,0 +1,116 @@
+""" CAT helpers on a scripted port """
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cat import read_menus
+
+
+class ScriptedPort:
+    """ Answers the EX queries with their code and 99, `stray` comes first """
+
+    def __init__(self, stray=b""):
+        self.input = bytearray(stray)
+
+    def write(self, data):
+        for query in data.split(b";")[:-1]:
+            self.input += query + b"99;"
+
+    def read_until(self, end):
+        index = self.input.find(end)
+        if index < 0:
+            return b""
+        frame, self.input = bytes(self.input[:index + 1]), self.input[index + 1:]
+        return frame
+
+
+QUERIES = [b"EX0101;", b"EX0102;", b"EX0103;"]
+EXPECTED = {b"EX0101;": b"EX010199;", b"EX0102;": b"EX010299;", b"EX0103;": b"EX010399;"}
+
+
+def test_stray_frame_is_dropped():
+    replies, _ = read_menus(ScriptedPort(b"FA014074000;"), QUERIES)
+    assert replies == EXPECTED
+
+
+def test_stray_frame_goes_to_unsolicited():
+    pushed = []
+    replies, _ = read_menus(ScriptedPort(b"FA014074000;"), QUERIES, unsolicited=pushed.append)
+    assert replies == EXPECTED
+    assert pushed == [b"FA014074000;"]
+
+
+def test_reject_is_the_oldest_query():
+    port = ScriptedPort()
+    port.write = lambda data: port.input.extend(b"?;EX010299;EX010399;")
+    replies, _ = read_menus(port, QUERIES)
+    assert replies == {b"EX0101;": b"?;", b"EX0102;": b"EX010299;", b"EX0103;": b"EX010399;"}
+
+
+def test_stray_frame_in_the_middle_of_a_burst():
+    port = ScriptedPort()
+    port.write = lambda data: port.input.extend(b"EX010199;FA014074000;EX010299;EX010399;")
+    replies, _ = read_menus(port, QUERIES)
+    assert replies == EXPECTED
+
+
+class RatePort:
+    """ Radio at a CAT RATE, deaf to the bytes sent at another baudrate
+
+    `mute` FA; probes at `mute_rate` (any rate when None) are not answered,
+    as a radio slow to come back after a CAT RATE change.
+    """
+
+    def __init__(self, rate, mute=0, mute_rate=None, takes=True):
+        self.baudrate = self.rate = rate
+        self.mute, self.mute_rate = mute, mute_rate
+        self.takes = takes
+        self.input = b""
+
+    def reset_input_buffer(self):
+        self.input = b""
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        if self.baudrate != self.rate:
+            return
+        for frame in data.split(b";")[:-1]:
+            if frame.startswith(b"EX0506") and self.takes:
+                self.rate = {b"1": 9600, b"3": 38400}[frame[6:]]
+            elif frame == b"FA":
+                if self.mute and self.mute_rate in (None, self.rate):
+                    self.mute -= 1
+                else:
+                    self.input += b"FA014074000;"
+
+    def read_until(self, end):
+        frame, self.input = self.input, b""
+        return frame
+
+
+def test_switch_rate():
+    from cat import switch_rate
+
+    port = RatePort(9600)
+    assert switch_rate(port, 38400, settle=0) is True
+    assert (port.baudrate, port.rate) == (38400, 38400)
+
+
+def test_switch_rate_puts_the_radio_back():
+    from cat import switch_rate
+
+    # The radio takes 38400 but does not answer there
+    port = RatePort(9600, mute=2, mute_rate=38400)
+    assert switch_rate(port, 38400, settle=0) is False
+    assert (port.baudrate, port.rate) == (9600, 9600)
+
+
+def test_switch_rate_no_answer_at_all():
+    from cat import switch_rate
+
+    port = RatePort(9600, mute=99)
+    assert switch_rate(port, 38400, settle=0) is None
+    assert port.baudrate == 9600
@@ -0,0 +1,53 @@
+""" asyncio CAT client on the ft891:// simulator """
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ft891sim
+from client import CatError, open_client
+
+
+def test_reject_is_matched_to_its_frame():
+    frames = [b"FA007100000;", b"EX1617200;", b"FB007050000;"]
+
+    async def send():
+        async with await open_client("ft891://reject", 9600) as rig:
+            return await rig.send(frames)
+
+    results = asyncio.run(send())
+    assert results[frames[0]] is None
+    assert isinstance(results[frames[1]], CatError)
+    assert results[frames[2]] is None
+    radio = ft891sim.RIGS["reject"]
+    assert (radio.vfo_a, radio.vfo_b) == (7100000, 7050000)
+
+
+def test_set_many_reports_only_the_rejected_menu():
+    async def set_many():
+        async with await open_client("ft891://set_many", 9600) as rig:
+            errors = await rig.set_many({"0101": 1000, "1617": 70})
+            return errors, await rig.get("1617")
+
+    errors, vox_gain = asyncio.run(set_many())
+    assert errors == {}
+    assert vox_gain == 70
+
+
+def test_unknown_value_is_an_error():
+    radio = ft891sim.FT891()
+    ft891sim.RIGS["unknown"] = radio
+    # A value the table does not know, from another firmware
+    radio.menus["0706"] = b"7"
+
+    async def get():
+        async with await open_client("ft891://unknown", 9600) as rig:
+            try:
+                await rig.get("0706")
+            except CatError as e:
+                return str(e), await rig.get_many(["0706", "1617"])
+
+    error, values = asyncio.run(get())
+    assert "EX07067;" in error
+    assert values == {"1617": 50}
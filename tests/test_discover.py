@@ -0,0 +1,35 @@
+""" Serial port discovery, without opening any port """
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cat
+
+
+def port(device, vid=None, pid=None, interface=None, location=None):
+    return types.SimpleNamespace(device=device, vid=vid, pid=pid, interface=interface,
+                                 description=device, location=location, serial_number=None)
+
+
+PORTS = [port("/dev/ttyUSB0", 0x10C4, 0xEA70, "Enhanced COM Port", "1-1:1.0"),
+         port("/dev/ttyUSB1", 0x10C4, 0xEA70, "Standard COM Port", "1-1:1.1"),
+         port("/dev/ttyUSB2", 0x10C4, 0xEA60, "CP2102 USB to UART", "1-2:1.0"),
+         port("/dev/ttyS0")]
+
+
+def probed(monkeypatch, scan):
+    opened = []
+    monkeypatch.setattr(cat.serial.tools.list_ports, "comports", lambda: PORTS)
+    monkeypatch.setattr(cat, "probe_port", lambda device, rates: opened.append(device))
+    cat.discover_port("/dev/ttyACM0", ["9600"], deadline=1., path="/nonexistent/ports.json", scan=scan)
+    return sorted(opened)
+
+
+def test_only_the_cat_port_of_the_bridge_is_probed(monkeypatch):
+    assert probed(monkeypatch, True) == ["/dev/ttyACM0", "/dev/ttyUSB0"]
+
+
+def test_retries_probe_only_the_preferred_port(monkeypatch):
+    assert probed(monkeypatch, False) == ["/dev/ttyACM0"]
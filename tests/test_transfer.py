@@ -0,0 +1,106 @@
+""" Bulk transfers of the window on the ft891:// simulator """
+import os
+import sys
+import time
+import configparser
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def window(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    read = configparser.ConfigParser.read
+
+    def config(self, filenames, **kwargs):
+        result = read(self, os.path.join(ROOT, "CPyS.cfg"))
+        default = self["DEFAULT"]
+        default["linux_port"] = default["windows_port"] = "ft891://cancel?rate=9600&pacing=on"
+        default["baudrate"] = "9600"
+        default["auto_detect"] = "off"
+        default["cat_rate_upgrade"] = "off"
+        default["rigctld"] = "off"
+        return result
+
+    monkeypatch.setattr(configparser.ConfigParser, "read", config)
+    import CPyS_891
+
+    win = CPyS_891.MainWindow(app)
+
+    def wait(cond, timeout=5.):
+        end = time.monotonic() + timeout
+        while not cond() and time.monotonic() < end:
+            app.processEvents()
+            time.sleep(0.001)
+        app.processEvents()
+        return cond()
+
+    win.wait = wait
+    assert wait(lambda: win.online)
+    yield win
+    win.worker.cancel()
+    win.cat_thread.quit()
+    win.cat_thread.wait()
+    win.worker.close()
+
+
+def test_cancel_stops_a_running_get(window):
+    # The whole menu takes about 1.4 s at 9600 bds
+    window.get_from_radio_action.trigger()
+    assert window.wait(lambda: window.progressbar.value() > 0)
+    start = time.monotonic()
+    window.cancel_transfer_action.trigger()
+    assert window.worker.cancel_event.is_set()
+    assert window.wait(lambda: not window.cancel_transfer_action.isEnabled())
+    assert time.monotonic() - start < 0.5
+    assert "155 parameters" not in window.status_bar.currentMessage()
+
+
+def test_reset_is_not_journaled():
+    from CPyS_891 import CatWorker
+
+    worker = CatWorker("ft891://journal", ["9600"], False)
+    worker.journal_frames(b"EX17010;EX1617070;EX17012;FA007100000;")
+    assert list(worker.journal.values()) == [b"EX1617070;", b"FA007100000;"]
+
+
+def test_tooltip_of_an_unknown_value(window):
+    from PyQt5.QtCore import Qt
+
+    model = window.menu_model
+    model.set_rejected({"0706": b"EX07067;"})
+    tooltip = model.data(model.index(model.row_of["0706"], 2), Qt.ToolTipRole)
+    assert tooltip == "Not applied, the FT-891 answered EX07067;"
+
+
+def test_memory_channel_not_read_back_is_not_applied(window, monkeypatch):
+    import ft891sim
+
+    radio = ft891sim.RIGS["cancel"]
+    window.memory_action.trigger()
+    memory_window = window.memory_window
+    memory_window.read_btn.click()
+    assert window.wait(lambda: not window.cancel_transfer_action.isEnabled(), 10)
+
+    model = memory_window.model
+    model.setData(model.index(0, 0), 14075000)
+    model.setData(model.index(1, 0), 7075000)
+    memory = radio.memory
+
+    def deaf(name, arg):
+        # Channel 002 is written, its read-back is not answered
+        return b"" if (name, arg) == (b"MT", b"002") else memory(name, arg)
+
+    monkeypatch.setattr(radio, "memory", deaf)
+    memory_window.write_btn.click()
+    assert window.wait(lambda: not window.cancel_transfer_action.isEnabled(), 10)
+    message = window.status_bar.currentMessage()
+    assert message.startswith("Done - 1 memory channels written")
+    assert message.endswith("1 not applied (1 not read back)")
+    assert window.memory_table.changed_rows() == [1]